@@ -1,3 +1,4 @@
+import functools
 import subprocess
 import shutil
 import os
@@ -12,6 +13,61 @@ def ensure_tool(name: str):
     if shutil.which(name) is None:
         raise RuntimeError(f"Required tool '{name}' not found in PATH")
 
+
+@functools.lru_cache(maxsize=16)
+def _build_effect_chain(grit_drive: int, grit_color: int, chorus_ms: int,
+                        grit_mode: str, voice_volume_db: float) -> tuple:
+    """
+    Build the sox effect-chain arguments for one parameter combination.
+
+    The chain only depends on the effect settings, which in practice stay
+    fixed for a whole session, so it's assembled once per combination and
+    reused instead of being re-built (and re-stringified) on every call.
+    """
+    chain = []
+
+    # Add grit effect based on mode (only if grit_drive > 0)
+    if grit_drive > 0:
+        if grit_mode == "overdrive":
+            # Classic overdrive distortion
+            chain.extend(["overdrive", str(grit_drive), str(grit_color)])
+        elif grit_mode == "compression":
+            # Gentler compression for punch and presence
+            # Format: attack,decay in-dB1,out-dB1,in-dB2,out-dB2
+            # Changed from -60,-40,-10 to -60,-50,-10 for less aggressive boost
+            chain.extend(["compand", "0.01,0.1", "-60,-50,-10"])
+        elif grit_mode == "eq":
+            # Mid-range boost for presence and edge
+            # Boost around 2.5kHz (presence range)
+            boost_db = min(grit_drive, 8)  # Cap at +8dB
+            chain.extend(["equalizer", "2500", "1000q", f"+{boost_db}"])
+        elif grit_mode == "combo":
+            # Gentler compression + EQ for gravelly sound without doubling
+            chain.extend(["compand", "0.01,0.1", "-60,-50,-10"])
+            boost_db = min(grit_drive, 6)  # Slightly lower for combo
+            chain.extend(["equalizer", "2500", "1000q", f"+{boost_db}"])
+
+    # Add chorus only if chorus_ms > 0
+    # Sox requires chorus delay > 20ms, so clamp to minimum if needed
+    if chorus_ms > 0:
+        effective_chorus = max(20, chorus_ms)  # Clamp to sox minimum
+        # Sox chorus format: gain-in gain-out delay decay speed depth [ -s | -t ]
+        chain.extend(["chorus", "0.6", "0.9", str(effective_chorus), "0.4", "0.25", "2", "-t"])
+
+    # Add EQ (bass+3 treble-2)
+    chain.extend(["bass", "+3", "treble", "-2"])
+
+    # Add brick-wall limiter to prevent clipping (especially important for laptop speakers)
+    # This compand acts as a limiter: very fast attack (0.001s), short release (0.1s)
+    # Soft knee limiting starting at -6dB, hard limiting at -0.5dB to prevent clipping
+    # Format: attack,decay soft-knee-dB:out-dB,hard-limit-dB:out-dB gain initial-volume delay
+    chain.extend(["compand", "0.001,0.1", "-6,-5,-0.5,-0.5", "0", "-90", "0.1"])
+
+    # Apply output volume control
+    chain.extend(["gain", str(voice_volume_db)])
+
+    return tuple(chain)
+
 def process_klatooinian(in_wav: str, out_wav: str, semitones: int = -3,
                         grit_drive: int = 5, grit_color: int = 10,
                         chorus_ms: int = 20, grit_mode: str = "overdrive",
@@ -57,49 +113,10 @@ def process_klatooinian(in_wav: str, out_wav: str, semitones: int = -3,
         in_wav, tmp
     ], **subprocess_kwargs)
 
-    # Build sox command starting with input/output
+    # Cached effect chain: rebuilt only when the settings change
     sox_cmd = ["sox", tmp, out_wav]
-    
-    # Add grit effect based on mode (only if grit_drive > 0)
-    if grit_drive > 0:
-        if grit_mode == "overdrive":
-            # Classic overdrive distortion
-            sox_cmd.extend(["overdrive", str(grit_drive), str(grit_color)])
-        elif grit_mode == "compression":
-            # Gentler compression for punch and presence
-            # Format: attack,decay in-dB1,out-dB1,in-dB2,out-dB2
-            # Changed from -60,-40,-10 to -60,-50,-10 for less aggressive boost
-            sox_cmd.extend(["compand", "0.01,0.1", "-60,-50,-10"])
-        elif grit_mode == "eq":
-            # Mid-range boost for presence and edge
-            # Boost around 2.5kHz (presence range)
-            boost_db = min(grit_drive, 8)  # Cap at +8dB
-            sox_cmd.extend(["equalizer", "2500", "1000q", f"+{boost_db}"])
-        elif grit_mode == "combo":
-            # Gentler compression + EQ for gravelly sound without doubling
-            sox_cmd.extend(["compand", "0.01,0.1", "-60,-50,-10"])
-            boost_db = min(grit_drive, 6)  # Slightly lower for combo
-            sox_cmd.extend(["equalizer", "2500", "1000q", f"+{boost_db}"])
-    
-    # Add chorus only if chorus_ms > 0
-    # Sox requires chorus delay > 20ms, so clamp to minimum if needed
-    if chorus_ms > 0:
-        effective_chorus = max(20, chorus_ms)  # Clamp to sox minimum
-        # Sox chorus format: gain-in gain-out delay decay speed depth [ -s | -t ]
-        sox_cmd.extend(["chorus", "0.6", "0.9", str(effective_chorus), "0.4", "0.25", "2", "-t"])
-
-
-    # Add EQ (bass+3 treble-2)
-    sox_cmd.extend(["bass", "+3", "treble", "-2"])
-
-    # Add brick-wall limiter to prevent clipping (especially important for laptop speakers)
-    # This compand acts as a limiter: very fast attack (0.001s), short release (0.1s)
-    # Soft knee limiting starting at -6dB, hard limiting at -0.5dB to prevent clipping
-    # Format: attack,decay soft-knee-dB:out-dB,hard-limit-dB:out-dB gain initial-volume delay
-    sox_cmd.extend(["compand", "0.001,0.1", "-6,-5,-0.5,-0.5", "0", "-90", "0.1"])
-
-    # Apply output volume control
-    sox_cmd.extend(["gain", str(voice_volume_db)])
+    sox_cmd.extend(_build_effect_chain(grit_drive, grit_color, chorus_ms,
+                                       grit_mode, voice_volume_db))
 
     subprocess.run(sox_cmd, **subprocess_kwargs)
 
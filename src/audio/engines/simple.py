@@ -2,10 +2,89 @@
 Simple TTS synthesis using macOS built-in 'say' command as a fallback.
 This avoids the need to download large models from HuggingFace.
 """
+import asyncio
 import subprocess
 import os
+import threading
+import time
 from pathlib import Path
 
+import numpy as np
+import soundfile as sf
+import soxr
+
+
+class _SayPool:
+    """
+    Persistent speech synthesizer shared across utterances.
+
+    Forking 'say' costs ~10-30ms of process setup per call, which dominates
+    short lines. Where PyObjC is available this holds one NSSpeechSynthesizer
+    (the same engine 'say' wraps) and renders each utterance straight to its
+    AIFF without relaunching anything; callers fall back to the 'say'
+    subprocess when it isn't.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._synth = None
+
+    def render(self, text: str, voice: str, rate: int, aiff_path: str) -> bool:
+        """Render text to aiff_path. Returns False if PyObjC is unavailable."""
+        try:
+            from AppKit import NSSpeechSynthesizer
+            from Foundation import NSURL
+        except ImportError:
+            return False
+
+        # setVoice_ wants an identifier and fails silently on a bare name;
+        # if _voice_id couldn't resolve one, let the 'say' fallback match
+        # the name instead of rendering with the wrong voice
+        if "." not in voice:
+            return False
+
+        with self._lock:
+            if self._synth is None:
+                self._synth = NSSpeechSynthesizer.alloc().initWithVoice_(None)
+            synth = self._synth
+            synth.setVoice_(voice)
+            synth.setRate_(rate)
+            if not synth.startSpeakingString_toURL_(
+                text, NSURL.fileURLWithPath_(aiff_path)
+            ):
+                return False
+            # File rendering is fast (no realtime playback); poll briefly
+            while synth.isSpeaking():
+                time.sleep(0.01)
+        return True
+
+
+_SAY_POOL = _SayPool()
+
+# Voice name -> identifier table, asked of NSSpeechSynthesizer on first
+# use. Resolving the identifier once lets the pooled synthesizer skip the
+# per-call voice lookup; names the engine doesn't report pass through
+# unchanged and stay on the 'say' path, which matches names itself.
+_VOICE_IDS = None
+
+
+def _voice_id(voice: str) -> str:
+    """Resolve a voice name to its synthesizer identifier (cached)."""
+    global _VOICE_IDS
+    if _VOICE_IDS is None:
+        _VOICE_IDS = {}
+        try:
+            from AppKit import NSSpeechSynthesizer
+        except ImportError:
+            pass  # no PyObjC; 'say' resolves plain names itself
+        else:
+            for identifier in NSSpeechSynthesizer.availableVoices():
+                attrs = NSSpeechSynthesizer.attributesForVoice_(identifier)
+                name = attrs.get("VoiceName") if attrs else None
+                if name:
+                    _VOICE_IDS[str(name)] = str(identifier)
+    return _VOICE_IDS.get(voice, voice)
+
 def synth_to_wav(text: str, wav_path: str, sample_rate: int = 24000, voice: str = "Alex"):
     """
     Synthesize speech using macOS 'say' command.
@@ -19,31 +98,76 @@ def synth_to_wav(text: str, wav_path: str, sample_rate: int = 24000, voice: str
     - Karen - Female voice (Australian)
     - And many more...
     """
-    # Use macOS 'say' command to generate audio
-    # -o outputs to file, -r sets rate (words per minute)
     aiff_path = str(Path(wav_path).with_suffix(".aiff"))
-    tmp_wav = str(Path(wav_path).with_suffix(".tmp.wav"))
-
-    # Generate AIFF file with 'say'
-    subprocess.run([
-        "say", "-o", aiff_path,
-        "-v", voice,   # Use specified voice
-        "-r", "70",   # Slightly slower speech rate (was 180 for Alex)
-        ##"[[pbas .5]] " + text
-        text
-    ], check=True)
-
-    # Convert AIFF to WAV with minimal padding
-    # Using --window-long in rubberband handles edge artifacts, so we only need
-    # minimal padding: 0.1s at start for safety, 0.5s at end to prevent tail clipping
-    subprocess.run([
-        "sox", aiff_path, "-r", str(sample_rate), tmp_wav, "pad", "0.15", "0.5"
-    ], check=True)
-
-    # Move temp file to final destination
-    Path(tmp_wav).rename(wav_path)
-
-    # Clean up AIFF file
-    Path(aiff_path).unlink(missing_ok=True)
+
+    # Render through the persistent synthesizer when PyObjC is available;
+    # otherwise fork 'say'. Both write a temp AIFF — AIFF needs a seekable
+    # sink to back-patch its header sizes, so a pipe is not an option
+    if _SAY_POOL.render(text, _voice_id(voice), 70, aiff_path):
+        _convert_aiff_to_wav(aiff_path, wav_path, sample_rate)
+    else:
+        subprocess.run([
+            "say", "-o", aiff_path,
+            "-v", voice,   # Plain name; say does its own voice lookup
+            "-r", "70",   # Slightly slower speech rate (was 180 for Alex)
+            ##"[[pbas .5]] " + text
+            text
+        ], check=True)
+        _convert_aiff_to_wav(aiff_path, wav_path, sample_rate)
 
     return wav_path
+
+
+async def synth_to_wav_async(text: str, wav_path: str, sample_rate: int = 24000, voice: str = "Alex"):
+    """
+    Async variant of synth_to_wav for callers already on an event loop
+    (e.g. alongside the Roll20 service).
+
+    'say' runs via asyncio's subprocess support so the loop keeps serving
+    browser I/O while speech renders, and the AIFF->WAV conversion happens
+    in a worker thread for the same reason.
+    """
+    aiff_path = str(Path(wav_path).with_suffix(".aiff"))
+
+    # The pooled synthesizer blocks while polling, so run it in a thread
+    if await asyncio.to_thread(_SAY_POOL.render, text, _voice_id(voice), 70, aiff_path):
+        await asyncio.to_thread(_convert_aiff_to_wav, aiff_path, wav_path, sample_rate)
+    else:
+        proc = await asyncio.create_subprocess_exec(
+            "say", "-o", aiff_path,
+            "-v", voice, "-r", "70", text,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        await proc.wait()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, "say")
+        await asyncio.to_thread(_convert_aiff_to_wav, aiff_path, wav_path, sample_rate)
+
+    return wav_path
+
+
+def _convert_aiff_to_wav(aiff_path: str, wav_path: str, sample_rate: int) -> None:
+    """
+    Convert say's AIFF output to a padded WAV in-process: libsndfile reads
+    the AIFF, soxr (the same SIMD resampler sox uses) handles the rate
+    change, and numpy adds the padding — no fork/exec, no tmp-file rename.
+
+    Using --window-long in rubberband handles edge artifacts, so we only need
+    minimal padding: 0.15s at start for safety, 0.5s at end to prevent tail clipping.
+    """
+    try:
+        data, src_rate = sf.read(aiff_path, dtype="float32")
+        if src_rate != sample_rate:
+            data = soxr.resample(data, src_rate, sample_rate, quality="HQ")
+        data = np.concatenate([
+            np.zeros(int(0.15 * sample_rate), dtype="float32"),
+            data,
+            np.zeros(int(0.5 * sample_rate), dtype="float32"),
+        ])
+        sf.write(wav_path, data, sample_rate, subtype="PCM_16")
+    except Exception:
+        # Don't leave a partial WAV behind for downstream stages to pick up
+        Path(wav_path).unlink(missing_ok=True)
+        raise
+    finally:
+        Path(aiff_path).unlink(missing_ok=True)
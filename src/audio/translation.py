@@ -1,7 +1,7 @@
 import re
 import random
 import os
-from typing import Callable
+from typing import Callable, Optional, Sequence
 from dotenv import load_dotenv
 
 # Load .env file
@@ -264,7 +264,8 @@ def rewrite_to_huttese(
     text: str,
     seed: int = 42,
     strip_stop_words: bool = True,
-    strip_every_nth: int = 0
+    strip_every_nth: int = 0,
+    literal_phrases: Optional[Sequence[str]] = None
 ) -> str:
     """
     Deterministic rewrite -> "Huttese-ish"
@@ -282,6 +283,7 @@ def rewrite_to_huttese(
         seed: Random seed for deterministic transformations
         strip_stop_words: If True (default), remove common English stop words to shorten output
         strip_every_nth: If > 0, also strip every Nth word after stop word removal (0 = disabled)
+        literal_phrases: Phrases to preserve as-is; defaults to the LITERAL_PHRASES env var
 
     Returns:
         Transformed "Huttese-ish" text
@@ -305,8 +307,13 @@ def rewrite_to_huttese(
     # Match only "text" (double quotes) - single quotes are used for contractions
     s = re.sub(r"\"([^\"]+)\"", save_preserved, text)
     
-    # Second, replace literal phrases from environment variable
-    literal_phrases = _get_literal_phrases()
+    # Second, replace literal phrases (explicit argument, or the
+    # LITERAL_PHRASES environment variable when none is given)
+    if literal_phrases is None:
+        literal_phrases = _get_literal_phrases()
+    else:
+        # Longest first, so "Star Wars" matches before "Star"
+        literal_phrases = sorted(literal_phrases, key=len, reverse=True)
     
     # Before replacing literals with placeholders, check if original text starts/ends with a literal
     # This is needed so _strip_words can preserve the position of literals
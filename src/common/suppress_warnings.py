@@ -17,6 +17,14 @@ warnings.filterwarnings("ignore", message=".*Defaulting repo_id to hexgrad/Kokor
 
 # Suppress TTS library's verbose console output
 # The TTS library prints directly to stdout, so we need to redirect it
+
+# One shared sink opened at import: entering the context is then just two
+# attribute rebinds instead of two open() syscalls, and __exit__ never
+# closes anything, so nested or repeated use can't close an FD that another
+# context (or a captured reference) still holds.
+_NULL_SINK = open(os.devnull, 'w')
+
+
 class SuppressTTSOutput:
     """Context manager to suppress TTS library's verbose output."""
     
@@ -28,15 +36,13 @@ class SuppressTTSOutput:
         # Save original stdout/stderr
         self.original_stdout = sys.stdout
         self.original_stderr = sys.stderr
-        # Redirect to devnull
-        sys.stdout = open(os.devnull, 'w')
-        sys.stderr = open(os.devnull, 'w')
+        # Redirect to the shared devnull sink
+        sys.stdout = _NULL_SINK
+        sys.stderr = _NULL_SINK
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Restore original stdout/stderr
-        sys.stdout.close()
-        sys.stderr.close()
+        # Restore original stdout/stderr (the shared sink stays open)
         sys.stdout = self.original_stdout
         sys.stderr = self.original_stderr
         return False
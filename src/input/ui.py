@@ -70,9 +70,9 @@ from ..audio.effects import (
     VOICE_VOLUME_DEFAULT_DB
 )
 from ..audio.engines.simple import synth_to_wav
-from ..roll20.service import Roll20Service, ServiceState
-from ..roll20.config import config as roll20_config
-from ..roll20.verbose import vprint
+from ..roll20.service import Roll20Service, ServiceState, install_uvloop
+from ..roll20.config import get_config as get_roll20_config
+from ..roll20 import verbose
 from ..config.settings import load_settings, save_settings, load_history, save_history
 
 
@@ -162,87 +162,104 @@ class HistoryLineEdit(QLineEdit):
             self.recall_stack.append(text)
 
 
+def _run_synthesis(text, settings, tmp_dir, on_translated=None):
+    """
+    Translate, synthesize, apply effects and play one line of text.
+
+    This is the whole pipeline SynthesisWorker runs, kept free of Qt so it
+    can be exercised (and tested) without constructing a QThread.
+    on_translated is called with (english, huttese) as soon as the rewrite
+    finishes, before synthesis starts. Returns (huttese, elapsed_seconds).
+    """
+    start_time = time.time()
+
+    # Rewrite to Huttese
+    huttese = rewrite_to_huttese(
+        text,
+        seed=settings.get('seed', 42),
+        strip_every_nth=settings.get('strip_every_nth', 3)
+    )
+
+    # Report the translation immediately so the UI can update right away,
+    # before synthesis
+    if on_translated is not None:
+        on_translated(text, huttese)
+
+    # Generate temporary file paths
+    tmp_raw = tmp_dir / f"raw_{int(time.time() * 1000)}.wav"
+    tmp_fx = tmp_dir / f"fx_{int(time.time() * 1000)}.wav"
+
+    try:
+        # Suppress TTS output
+        old_stdout = sys.stdout
+        old_stderr = sys.stderr
+        sys.stdout = open("/dev/null", "w")
+        sys.stderr = open("/dev/null", "w")
+
+        try:
+            # Synthesize
+            synth_to_wav(
+                huttese,
+                str(tmp_raw),
+                voice=settings.get('voice', 'Lee')
+            )
+
+            # Apply effects
+            process_klatooinian(
+                str(tmp_raw), str(tmp_fx),
+                semitones=settings.get('semitones', -2),
+                grit_drive=settings.get('grit_drive', 0),
+                grit_color=settings.get('grit_color', 10),
+                chorus_ms=settings.get('chorus_ms', 0),
+                grit_mode=settings.get('grit_mode', 'combo'),
+                tempo=settings.get('tempo', 0.9),
+                voice_volume_db=settings.get('voice_volume_db', VOICE_VOLUME_DEFAULT_DB),
+            )
+        finally:
+            sys.stdout.close()
+            sys.stderr.close()
+            sys.stdout = old_stdout
+            sys.stderr = old_stderr
+
+        # Play audio
+        # Use larger blocksize to prevent buffer underruns in UI environment
+        # which can cause crackling on laptop speakers
+        data, sr = sf.read(str(tmp_fx), dtype="float32")
+        output_device = settings.get('output_device')
+        sd.play(data, sr, blocksize=4096, device=output_device)
+        sd.wait()
+
+        return huttese, time.time() - start_time
+
+    finally:
+        # Cleanup
+        tmp_raw.unlink(missing_ok=True)
+        tmp_fx.unlink(missing_ok=True)
+
+
 class SynthesisWorker(QThread):
     """Background thread for audio synthesis and playback."""
     translation_ready = pyqtSignal(str, str)  # english, huttese - emitted immediately after translation
     finished = pyqtSignal(float)  # elapsed_time - emitted after playback
     error = pyqtSignal(str)
-    
+
     def __init__(self, text, settings):
         super().__init__()
         self.text = text
         self.settings = settings
         self.tmp_dir = Path("/tmp/huttese_ui")
         self.tmp_dir.mkdir(exist_ok=True)
-    
+
     def run(self):
         """Run synthesis in background thread."""
         try:
-            start_time = time.time()
-            
-            # Rewrite to Huttese
-            huttese = rewrite_to_huttese(
+            _, elapsed = _run_synthesis(
                 self.text,
-                seed=self.settings.get('seed', 42),
-                strip_every_nth=self.settings.get('strip_every_nth', 3)
+                self.settings,
+                self.tmp_dir,
+                on_translated=self.translation_ready.emit,
             )
-            
-            # Emit translation ready signal immediately after rewrite
-            # This allows the UI to update right away, before synthesis
-            self.translation_ready.emit(self.text, huttese)
-            
-            # Generate temporary file paths
-            tmp_raw = self.tmp_dir / f"raw_{int(time.time() * 1000)}.wav"
-            tmp_fx = self.tmp_dir / f"fx_{int(time.time() * 1000)}.wav"
-            
-            try:
-                # Suppress TTS output
-                old_stdout = sys.stdout
-                old_stderr = sys.stderr
-                sys.stdout = open("/dev/null", "w")
-                sys.stderr = open("/dev/null", "w")
-                
-                try:
-                    # Synthesize
-                    synth_to_wav(
-                        huttese,
-                        str(tmp_raw),
-                        voice=self.settings.get('voice', 'Lee')
-                    )
-                    
-                    # Apply effects
-                    process_klatooinian(
-                        str(tmp_raw), str(tmp_fx),
-                        semitones=self.settings.get('semitones', -2),
-                        grit_drive=self.settings.get('grit_drive', 0),
-                        grit_color=self.settings.get('grit_color', 10),
-                        chorus_ms=self.settings.get('chorus_ms', 0),
-                        grit_mode=self.settings.get('grit_mode', 'combo'),
-                        tempo=self.settings.get('tempo', 0.9),
-                        voice_volume_db=self.settings.get('voice_volume_db', VOICE_VOLUME_DEFAULT_DB),
-                    )
-                finally:
-                    sys.stdout.close()
-                    sys.stderr.close()
-                    sys.stdout = old_stdout
-                    sys.stderr = old_stderr
-                
-                # Play audio
-                # Use larger blocksize to prevent buffer underruns in UI environment
-                # which can cause crackling on laptop speakers
-                data, sr = sf.read(str(tmp_fx), dtype="float32")
-                output_device = self.settings.get('output_device')
-                sd.play(data, sr, blocksize=4096, device=output_device)
-                sd.wait()
-                
-                elapsed = time.time() - start_time
-                self.finished.emit(elapsed)
-                
-            finally:
-                # Cleanup
-                tmp_raw.unlink(missing_ok=True)
-                tmp_fx.unlink(missing_ok=True)
-                
+            self.finished.emit(elapsed)
         except Exception as e:
             self.error.emit(str(e))
 
@@ -263,7 +280,9 @@ class Roll20Worker(QThread):
     def run(self):
         """Run the Roll20 service in an asyncio event loop."""
         try:
-            # Create a new event loop for this thread
+            # Create a new event loop for this thread (uvloop's, when the
+            # policy install succeeds — it must precede loop creation)
+            install_uvloop()
             self.loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
 
@@ -647,8 +666,16 @@ class HutteseUI(QMainWindow):
         # Show processing status
         self.statusBar().showMessage("Processing...")
 
-        # Send to Roll20 in parallel with audio synthesis
-        if self.roll20_worker and roll20_config.target_users:
+        # Send to Roll20 in parallel with audio synthesis. A missing or
+        # incomplete Roll20 environment raises ValueError here; that only
+        # means there is nothing to send to — local audio still plays
+        roll20_config = None
+        if self.roll20_worker:
+            try:
+                roll20_config = get_roll20_config()
+            except ValueError:
+                verbose.vprint("\n[UI] Roll20 not configured; skipping send")
+        if roll20_config is not None and roll20_config.target_users:
             # Format the message for Roll20 (currently just the raw text)
             formatted_message = text
 
@@ -657,12 +684,12 @@ class HutteseUI(QMainWindow):
             if self.demo_mode and self.suppress_gm_checkbox and self.suppress_gm_checkbox.isChecked():
                 # Remove 'gm' from the target users list
                 target_users = [user for user in target_users if user.lower() != 'gm']
-                vprint(f"\n[UI] Demo mode: Suppressing GM message")
+                verbose.vprint(f"\n[UI] Demo mode: Suppressing GM message")
 
-            vprint(f"\n[UI] Sending to Roll20:")
-            vprint(f"  Target users: {target_users}")
-            vprint(f"  Original text: {repr(text)}")
-            vprint(f"  Formatted message: {repr(formatted_message)}")
+            verbose.vprint(f"\n[UI] Sending to Roll20:")
+            verbose.vprint(f"  Target users: {target_users}")
+            verbose.vprint(f"  Original text: {repr(text)}")
+            verbose.vprint(f"  Formatted message: {repr(formatted_message)}")
 
             if target_users:  # Only send if there are users to send to
                 # Delay the Roll20 message to allow audio synthesis to start first
@@ -721,13 +748,13 @@ class HutteseUI(QMainWindow):
         save_history(self.history)
 
         if self.roll20_worker:
-            vprint("\n[UI] Shutting down Roll20 service...")
+            verbose.vprint("\n[UI] Shutting down Roll20 service...")
             self.roll20_worker.stop()
             # Wait up to 5 seconds for graceful cleanup
             if not self.roll20_worker.wait(5000):
-                vprint("[UI] Warning: Roll20 worker did not stop gracefully")
+                verbose.vprint("[UI] Warning: Roll20 worker did not stop gracefully")
             else:
-                vprint("[UI] Roll20 service stopped gracefully")
+                verbose.vprint("[UI] Roll20 service stopped gracefully")
         event.accept()
 
 
@@ -803,6 +830,10 @@ def main():
         from ..roll20.verbose import set_verbose
         set_verbose(True)
 
+    # Roll20 client status goes through logging; --verbose enables debug detail
+    import logging
+    logging.basicConfig(level=logging.DEBUG if verbose else logging.INFO, format="%(message)s")
+
     if "--demo-mode" in sys.argv:
         demo_mode = True
         print("Running in DEMO MODE")
@@ -14,7 +14,7 @@ Main components:
 """
 
 from .client import Roll20Client
-from .config import Roll20Config, config
+from .config import Roll20Config, get_config
 from .service import Roll20Service, ServiceState
 
-__all__ = ["Roll20Service", "ServiceState", "Roll20Client", "Roll20Config", "config"]
+__all__ = ["Roll20Service", "ServiceState", "Roll20Client", "Roll20Config", "get_config"]
@@ -0,0 +1,67 @@
+"""
+Shared helpers for the manual test scripts (test_client, test_service, ...).
+
+Each script used to duplicate the --headless/--verbose argv walking and the
+banner/mode printing; parsing now happens once at import and the scripts
+just reference the cached result.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+
+_parser = argparse.ArgumentParser(add_help=False)
+_parser.add_argument("--headless", action="store_true")
+_parser.add_argument("--verbose", action="store_true")
+
+# Parsed once at module load; repeated references are O(1)
+ARGS, _ = _parser.parse_known_args(sys.argv[1:])
+HEADLESS = ARGS.headless
+VERBOSE = ARGS.verbose
+
+
+def setup_logging() -> None:
+    """Route client/service status through logging; --verbose adds debug detail."""
+    log_level = logging.DEBUG if VERBOSE else logging.INFO
+    logging.basicConfig(level=log_level, format="%(message)s")
+
+
+def print_banner(title: str, headless: bool = HEADLESS) -> None:
+    """Print the test banner and browser-mode note shared by every script."""
+    print("=" * 60)
+    print(title)
+    print("=" * 60)
+
+    if headless:
+        print("\nRunning in HEADLESS mode")
+        print("Note: Cloudflare may block headless browsers.\n")
+    else:
+        print("\nRunning in HEADFUL mode (browser visible)")
+        print("If Cloudflare challenges appear, complete them manually.\n")
+
+
+async def inspection_wait(seconds: float) -> None:
+    """
+    Hold the browser open for inspection, returning the moment the operator
+    hits Ctrl+C instead of sleeping out the full wall-clock padding.
+    """
+    shutdown = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, shutdown.set)
+        handler_installed = True
+    except (NotImplementedError, ValueError):
+        # Non-main thread or platform without signal handler support;
+        # fall back to a plain bounded wait
+        handler_installed = False
+
+    try:
+        await asyncio.wait_for(shutdown.wait(), timeout=seconds)
+        print("\nInterrupted - closing early")
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        if handler_installed:
+            loop.remove_signal_handler(signal.SIGINT)
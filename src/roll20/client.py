@@ -9,29 +9,147 @@ This module handles:
 """
 
 import asyncio
+import atexit
+import base64
+import json
+import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import nodriver as uc
 from platformdirs import user_cache_dir
 import hashlib
 
-from .config import config
+from .config import get_config
+
+# nodriver drags in websockets and the whole CDP layer; defer it to start()
+# so importing this module (e.g. for format_whisper via the package) stays
+# cheap for code that never opens a browser.
+if TYPE_CHECKING:
+    import nodriver as uc
+
+logger = logging.getLogger(__name__)
+
+
+# Warm browsers kept alive between client sessions, keyed by
+# (headless, user_data_dir). Launching Chrome costs seconds; reattaching to a
+# pooled browser is nearly free, which matters for repeated sessions (e.g.
+# dev reloads). Pooled browsers are stopped at interpreter exit.
+_browser_pool: dict[tuple[bool, str], "uc.Browser"] = {}
+_browser_pool_lock = asyncio.Lock()
+
+
+def _stop_pooled_browsers():
+    """Stop any browsers still parked in the pool (registered with atexit)."""
+    for browser in _browser_pool.values():
+        try:
+            browser.stop()
+        except Exception:
+            pass
+    _browser_pool.clear()
+
+
+atexit.register(_stop_pooled_browsers)
 
 
 class Roll20Client:
-    """Client for automating Roll20 interactions using nodriver."""
+    """
+    Client for automating Roll20 interactions using nodriver.
+
+    Can be used as an async context manager, which guarantees the browser is
+    released even when initialization fails partway through:
+
+        async with Roll20Client(headless=True) as client:
+            ...
+    """
+
+    # Total budget for the post-launch startup phase (chat UI verification
+    # and dialog dismissal share it; see _startup_time_left)
+    STARTUP_BUDGET_S = 45.0
 
-    def __init__(self):
-        self.browser: Optional[uc.Browser] = None
-        self.page: Optional[uc.Tab] = None
+    def __init__(self, headless: bool = False):
+        self.browser: Optional["uc.Browser"] = None
+        self.page: Optional["uc.Tab"] = None
         self._logged_in = False
         self._game_loaded = False
-        self._headless = True  # Track headless mode for error handling
+        self._headless = headless  # Track headless mode for error handling
+        self._user_data_dir: Optional[str] = None  # Set once start() resolves it
+        self._startup_deadline: Optional[float] = None  # Set by initialize()
+        self._external_browser = False  # True when attached via ROLL20_CDP_URL
         self._background_tasks: list[asyncio.Task] = []  # Track background tasks for cleanup
 
-        # We don't need element references anymore - we use JavaScript directly
+        # Chat element handles, cached by setup_chat_interface so sends don't
+        # re-query the DOM (the JS side keeps its own window.__r20_* cache)
+        self.chat_textarea = None
+        self.chat_send_button = None
+        self.speaking_as_dropdown = None
+
+    async def __aenter__(self) -> "Roll20Client":
+        try:
+            await self.initialize(headless=self._headless)
+        except BaseException:
+            # __aexit__ never runs when the with body was never entered,
+            # and a failed-init browser was never parked in the pool for
+            # atexit to stop — release it here before re-raising
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+    async def _wait_until(self, pred, timeout: float = 30.0, max_interval: float = 1.0) -> bool:
+        """
+        Poll a predicate with exponential backoff until it holds or times out.
+
+        Checks start at a 50ms cadence and double up to max_interval, so a
+        condition that holds in 200ms is caught in 200ms while a slow one
+        doesn't get hammered with checks for the whole timeout.
+
+        Args:
+            pred: Callable returning a truthy value (or an awaitable of one)
+            timeout: Maximum seconds to wait
+            max_interval: Cap on the seconds between checks
+
+        Returns:
+            True if the predicate held before the timeout, False otherwise
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+        delay = 0.05
+        while True:
+            result = pred()
+            if asyncio.iscoroutine(result):
+                result = await result
+            if result:
+                return True
+            if asyncio.get_running_loop().time() >= deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_interval)
+
+    def _startup_time_left(self, fallback: float) -> float:
+        """
+        Seconds left on the shared startup deadline, capped at fallback.
+
+        The post-launch waits (chat UI verification, dialog dismissal) all
+        draw from one deadline set by initialize(), so a slow editor load
+        eats into every wait instead of each one stacking its own worst
+        case. Outside initialize() the per-call fallback is used as-is.
+
+        Args:
+            fallback: Timeout to use when no deadline is active, and the cap
+                      on what is returned when one is
+
+        Returns:
+            Seconds to wait, always at least 0.5 so a wait can still observe
+            an element that is already present
+        """
+        if self._startup_deadline is None:
+            return fallback
+        remaining = self._startup_deadline - asyncio.get_running_loop().time()
+        return max(0.5, min(fallback, remaining))
 
     def _get_user_data_dir(self) -> str:
         """
@@ -46,6 +164,7 @@ class Roll20Client:
             Path to the user data directory
         """
         # Use platformdirs to get a proper cache directory
+        config = get_config()
         app_cache_dir = user_cache_dir("klatooinian-huttese-audio", "jonathanstokes")
         
         # Create a safe directory name from the username
@@ -72,13 +191,11 @@ class Roll20Client:
             Path to the saved screenshot, or None if capture failed.
         """
         if not self.page:
-            print("Cannot capture screenshot: no page loaded")
+            logger.info("Cannot capture screenshot: no page loaded")
             return None
 
         try:
-            # Create screenshots directory if it doesn't exist
             screenshots_dir = Path("screenshots")
-            screenshots_dir.mkdir(exist_ok=True)
 
             # Generate filename with timestamp if not provided
             if filename is None:
@@ -91,34 +208,51 @@ class Roll20Client:
 
             filepath = screenshots_dir / filename
 
-            print(f"Capturing screenshot to: {filepath}")
-            await self.page.save_screenshot(str(filepath))
-            print(f"✓ Screenshot saved: {filepath}")
+            logger.info(f"Capturing screenshot to: {filepath}")
+
+            # Capture to an in-memory buffer, then push the disk work (mkdir
+            # included) to a thread so the event loop isn't stalled on I/O and
+            # the write can overlap with e.g. capture_dom's HTML fetch.
+            b64_data = await self.page.save_screenshot(format='png', as_base64=True)
+            raw_bytes = base64.b64decode(b64_data)
+
+            def _write():
+                screenshots_dir.mkdir(exist_ok=True)
+                filepath.write_bytes(raw_bytes)
+
+            await asyncio.to_thread(_write)
+            logger.info(f"✓ Screenshot saved: {filepath}")
 
             return str(filepath)
 
         except Exception as e:
-            print(f"Failed to capture screenshot: {e}")
+            logger.warning(f"Failed to capture screenshot: {e}")
             return None
 
-    async def capture_dom(self, filename: Optional[str] = None) -> Optional[str]:
+    async def capture_dom(self, filename: Optional[str] = None, max_bytes: int = 512 * 1024) -> Optional[str]:
         """
         Capture the DOM (HTML) of the current page.
 
+        The full editor DOM serializes to multiple megabytes; for diagnosing
+        a failed initialization the first chunk (error banners, login forms)
+        is what matters, so the capture is capped to keep the CDP payload and
+        the disk write small on an already-degraded failure path.
+
         Args:
             filename: Optional filename. If not provided, uses timestamp.
+            max_bytes: Maximum HTML size to capture (default 512KB).
+                       Pass 0 to capture the full page.
 
         Returns:
             Path to the saved HTML file, or None if capture failed.
         """
         if not self.page:
-            print("Cannot capture DOM: no page loaded")
+            logger.info("Cannot capture DOM: no page loaded")
             return None
 
         try:
-            # Create screenshots directory if it doesn't exist (reuse same dir)
+            # Reuse the screenshots directory for all diagnostics
             screenshots_dir = Path("screenshots")
-            screenshots_dir.mkdir(exist_ok=True)
 
             # Generate filename with timestamp if not provided
             if filename is None:
@@ -131,21 +265,32 @@ class Roll20Client:
 
             filepath = screenshots_dir / filename
 
-            print(f"Capturing DOM to: {filepath}")
+            logger.info(f"Capturing DOM to: {filepath}")
 
-            # Get the page HTML
-            html = await self.page.get_content()
+            # Get the page HTML, sliced in-page so only the capped amount
+            # crosses the CDP connection
+            if max_bytes > 0:
+                html = await self.page.evaluate(
+                    f"document.documentElement.outerHTML.slice(0, {max_bytes})"
+                )
+                if len(html) >= max_bytes:
+                    html += f"\n<!-- truncated at {max_bytes} bytes -->\n"
+            else:
+                html = await self.page.get_content()
+
+            # Save to file off the event loop
+            def _write():
+                screenshots_dir.mkdir(exist_ok=True)
+                filepath.write_text(html, encoding='utf-8')
 
-            # Save to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html)
+            await asyncio.to_thread(_write)
 
-            print(f"✓ DOM saved: {filepath}")
+            logger.info(f"✓ DOM saved: {filepath}")
 
             return str(filepath)
 
         except Exception as e:
-            print(f"Failed to capture DOM: {e}")
+            logger.warning(f"Failed to capture DOM: {e}")
             return None
 
     async def start(self, headless: bool = False):
@@ -160,14 +305,16 @@ class Roll20Client:
         Returns:
             True if already logged in, False if login is needed
         """
+        import nodriver as uc
+
         self._headless = headless
 
         if headless:
-            print(f"Starting browser in HEADLESS mode...")
-            print("Note: Cloudflare may block headless browsers. If you encounter issues,")
-            print("try running in headful mode (headless=False).")
+            logger.info(f"Starting browser in HEADLESS mode...")
+            logger.info("Note: Cloudflare may block headless browsers. If you encounter issues,")
+            logger.info("try running in headful mode (headless=False).")
         else:
-            print(f"Starting browser in HEADFUL mode (browser will be visible)...")
+            logger.info(f"Starting browser in HEADFUL mode (browser will be visible)...")
 
         # Chrome preferences to disable password manager
         prefs = {
@@ -175,8 +322,25 @@ class Roll20Client:
             'profile.password_manager_enabled': False,
         }
 
-        # Browser arguments for better headless mode and Cloudflare bypass
-        browser_args = []
+        # Browser arguments that speed up browser start in both modes:
+        # skip the first-run wizard, extension loading, background network
+        # chatter (GCM, field trials, component updates) and translation UI.
+        browser_args = [
+            '--disable-extensions',
+            '--disable-background-networking',
+            '--disable-sync',
+            '--no-first-run',
+            '--no-default-browser-check',
+            '--disable-component-update',
+            '--metrics-recording-only',
+            '--disable-default-apps',
+            '--mute-audio',
+            '--disable-translate',
+        ]
+
+        # Chromium only honours the last --disable-features flag, so build the
+        # feature list once and extend it for headless mode below.
+        disabled_features = ['Translate', 'OptimizationHints', 'MediaRouter']
 
         if headless:
             # Use new headless mode which is harder to detect
@@ -188,76 +352,112 @@ class Roll20Client:
                 '--no-sandbox',
                 '--disable-setuid-sandbox',
                 '--disable-web-security',
-                '--disable-features=IsolateOrigins,site-per-process',
                 '--allow-running-insecure-content',
             ])
+            disabled_features.extend(['IsolateOrigins', 'site-per-process'])
+
+        browser_args.append('--disable-features=' + ','.join(disabled_features))
 
         # Create config with user data directory for session persistence
         user_data_dir = self._get_user_data_dir()
-        print(f"Using user data directory: {user_data_dir}")
-        
-        config = uc.Config(
-            headless=headless,
-            prefs=prefs,
-            browser_args=browser_args if browser_args else None,
-            user_data_dir=user_data_dir,
-        )
-
-        self.browser = await uc.start(config)
+        self._user_data_dir = user_data_dir
+        logger.info(f"Using user data directory: {user_data_dir}")
+
+        # Attach to an externally managed Chromium when ROLL20_CDP_URL is
+        # set (e.g. a chromium --remote-debugging-port=9222 sidecar kept
+        # alive across test-script runs), otherwise reuse a warm pooled
+        # browser, otherwise pay the multi-second Chrome launch once.
+        cdp_url = os.environ.get("ROLL20_CDP_URL")
+
+        async with _browser_pool_lock:
+            pooled = None if cdp_url else _browser_pool.pop((headless, user_data_dir), None)
+
+        if cdp_url:
+            from urllib.parse import urlparse
+
+            parsed = urlparse(cdp_url if "//" in cdp_url else f"http://{cdp_url}")
+            logger.info(f"Attaching to external browser at {parsed.hostname}:{parsed.port}")
+            self.browser = await uc.start(host=parsed.hostname, port=parsed.port)
+            self._external_browser = True
+        elif pooled is not None and not getattr(pooled, 'stopped', True):
+            logger.info("Reusing warm browser from pool")
+            self.browser = pooled
+        else:
+            config = uc.Config(
+                headless=headless,
+                prefs=prefs,
+                browser_args=browser_args,
+                user_data_dir=user_data_dir,
+            )
+            self.browser = await uc.start(config)
 
         # Always start by going to the main Roll20 page
-        print("Navigating to https://app.roll20.net...")
+        logger.info("Navigating to https://app.roll20.net...")
         self.page = await self.browser.get("https://app.roll20.net")
 
-        # Wait for page to load and potential redirect
-        await asyncio.sleep(3)
+        # Detect the login redirect in-page rather than sleeping a fixed 5s:
+        # the promise resolves 'login' the moment the URL or a login form
+        # shows up, or 'ok' once the page has finished loading without either.
+        logger.info("Checking if actually logged in...")
+        login_check_script = """
+            new Promise((resolve) => {
+                var check = function() {
+                    if (location.href.includes('/login') || document.querySelector('#loginform')) {
+                        resolve('login');
+                    } else if (document.readyState === 'complete') {
+                        resolve('ok');
+                    } else {
+                        setTimeout(check, 100);
+                    }
+                };
+                check();
+            })
+        """
+        try:
+            result = await asyncio.wait_for(
+                self.page.evaluate(login_check_script, await_promise=True),
+                timeout=8,
+            )
+        except asyncio.TimeoutError:
+            # Page still loading after 8s; fall back to the URL check below
+            result = None
 
         current_url = self.page.url
-        print(f"Current URL: {current_url}")
+        logger.info(f"Current URL: {current_url}")
 
         # Check if we were redirected to login
-        if "/login" in current_url:
-            print("Not logged in - on login page")
-            return False
-
-        # Even if we're at the main page, we might not be logged in
-        # The page might just not redirect immediately
-        # Let's check if we can see login-related elements
-        print("Checking if actually logged in...")
-
-        # Wait a bit more to see if page redirects
-        await asyncio.sleep(2)
-        current_url = self.page.url
-
-        if "/login" in current_url:
-            print("Redirected to login page")
+        if result == 'login' or "/login" in current_url:
+            logger.info("Not logged in - on login page")
             return False
 
         # If we're still on the main page, assume we're logged in
         # (We'll find out for sure when we try to access the campaign)
-        print("Appears to be logged in (no redirect to login)")
+        logger.info("Appears to be logged in (no redirect to login)")
         self._logged_in = True
         return True
 
     async def login(self):
         """Log into Roll20 using credentials from config."""
         if self._logged_in:
-            print("Already logged in")
+            logger.info("Already logged in")
             return
 
+        config = get_config()
+
         current_url = self.page.url
 
         # If we're not on the login page, navigate there
         if "/login" not in current_url:
-            print("Navigating to login page...")
+            logger.info("Navigating to login page...")
             await self.page.get("https://app.roll20.net/login")
-            await asyncio.sleep(3)
 
-        # Wait briefly for the form to be fully interactive
-        await asyncio.sleep(2)
+        # Wait for the form via the MutationObserver bridge: one awaited CDP
+        # call that resolves the moment the field mounts, instead of
+        # nodriver's select() re-querying the DOM on a fixed cadence
+        await self.wait_for("input#email, input[name='email']", timeout_ms=15000)
 
         # Find and fill the email field
-        print("Looking for email field...")
+        logger.debug("Looking for email field...")
         email_field = await self.page.select("input#email")
         if not email_field:
             email_field = await self.page.select("input[name='email']")
@@ -266,12 +466,12 @@ class Roll20Client:
             await email_field.click()
             await asyncio.sleep(0.3)
             await email_field.send_keys(config.username)
-            print(f"✓ Entered email: {config.username}")
+            logger.debug(f"✓ Entered email: {config.username}")
         else:
             raise Exception("Could not find email input field")
 
         # Find and fill the password field
-        print("Looking for password field...")
+        logger.debug("Looking for password field...")
         password_field = await self.page.select("input#password")
         if not password_field:
             password_field = await self.page.select("input[name='password']")
@@ -280,35 +480,36 @@ class Roll20Client:
             await password_field.click()
             await asyncio.sleep(0.2)
             await password_field.send_keys(config.password)
-            print("✓ Entered password")
+            logger.debug("✓ Entered password")
         else:
             raise Exception("Could not find password input field")
 
         # Find and click the login button
-        print("Looking for login button...")
+        logger.debug("Looking for login button...")
         login_button = await self.page.select("button#login")
         if not login_button:
             login_button = await self.page.select("button[type='submit']")
 
         if login_button:
-            print("Clicking login button...")
+            logger.info("Clicking login button...")
             await login_button.click()
         else:
             raise Exception("Could not find login button")
 
-        # Wait for login to complete and page to load
-        print("Waiting for login to complete...")
-        await asyncio.sleep(10)
+        # Wait for login to complete and page to load; return as soon as the
+        # URL leaves /login instead of sleeping a fixed 10s
+        logger.info("Waiting for login to complete...")
+        await self._wait_until(lambda: "/login" not in self.page.url, timeout=30)
 
         # Check if we're logged in
         current_url = self.page.url
-        print(f"Current URL after login: {current_url}")
+        logger.info(f"Current URL after login: {current_url}")
 
         if "/login" in current_url:
             raise Exception("Login may have failed - still on login page. Check credentials or captcha.")
 
         self._logged_in = True
-        print("✓ Login successful!")
+        logger.info("✓ Login successful!")
 
     async def launch_game(self):
         """Navigate directly to the game editor using the setcampaign URL."""
@@ -316,56 +517,59 @@ class Roll20Client:
             raise Exception("Must be logged in before launching game")
 
         if self._game_loaded:
-            print("Game already loaded")
+            logger.info("Game already loaded")
             return
 
         # Use the direct setcampaign URL to launch/join the game
+        config = get_config()
         editor_url = f"https://app.roll20.net/editor/setcampaign/{config.campaign_id}"
-        print(f"Launching game: {editor_url}")
+        logger.info(f"Launching game: {editor_url}")
 
         await self.page.get(editor_url)
 
-        # Wait for the page to load
-        await asyncio.sleep(15)
+        # Wait for the page to either bounce us to login or start redirecting
+        # (no fixed 15s sleep: on typical runs this resolves in 1-3s)
+        def _left_setcampaign():
+            url = self.page.url
+            return "/login" in url or ("editor" in url and "setcampaign" not in url)
+
+        await self._wait_until(_left_setcampaign, timeout=15)
 
         # Check if we got redirected to login (means we weren't actually logged in)
         current_url = self.page.url
         if "/login" in current_url:
-            print("Got redirected to login - we weren't actually logged in!")
+            logger.info("Got redirected to login - we weren't actually logged in!")
             self._logged_in = False
             # Now perform the login
             await self.login()
             # Try launching the game again
-            print(f"Retrying game launch: {editor_url}")
+            logger.info(f"Retrying game launch: {editor_url}")
             await self.page.get(editor_url)
-            await asyncio.sleep(15)
+            await self._wait_until(_left_setcampaign, timeout=15)
             current_url = self.page.url
 
         # Wait for the URL to change FROM setcampaign to the actual editor
         # The setcampaign URL is a redirect page, not the actual editor
-        print("Waiting for redirect from setcampaign to actual editor...")
-        max_wait = 60  # Increased wait time for headless mode
-        waited = 0
-        while waited < max_wait:
-            current_url = self.page.url
+        logger.info("Waiting for redirect from setcampaign to actual editor...")
+        max_wait = config.editor_load_timeout  # Configurable via ROLL20_EDITOR_TIMEOUT
+
+        def _editor_loaded():
+            url = self.page.url
             # We want the editor URL but NOT the setcampaign URL
-            if "editor" in current_url and "setcampaign" not in current_url and "/login" not in current_url:
-                print(f"✓ Editor loaded! URL: {current_url}")
-                break
-            if waited % 5 == 0:  # Print status every 5 seconds
-                print(f"  Still waiting... Current URL: {current_url}")
-            await asyncio.sleep(1)
-            waited += 1
+            return "editor" in url and "setcampaign" not in url and "/login" not in url
+
+        if await self._wait_until(_editor_loaded, timeout=max_wait):
+            logger.info(f"✓ Editor loaded! URL: {self.page.url}")
 
         current_url = self.page.url
 
         # Check if we're still on setcampaign (redirect didn't happen)
         if "setcampaign" in current_url:
-            print(f"Warning: Still on setcampaign URL after {max_wait}s: {current_url}")
-            print("The page may not have redirected automatically.")
+            logger.info(f"Warning: Still on setcampaign URL after {max_wait}s: {current_url}")
+            logger.info("The page may not have redirected automatically.")
 
             # Try to find and click a "Join Game" or "Launch" button
-            print("Looking for a button to click to enter the game...")
+            logger.info("Looking for a button to click to enter the game...")
 
             # Check for common button texts
             button_texts = ["Join Game", "Launch", "Play Now", "Enter Game", "Continue"]
@@ -386,7 +590,7 @@ class Roll20Client:
                     """
                     result = await self.page.evaluate(script)
                     if result.get('found'):
-                        print(f"  Found button: {result.get('text')}")
+                        logger.debug(f"  Found button: {result.get('text')}")
                         # Click it
                         click_script = f"""
                             (function() {{
@@ -401,226 +605,353 @@ class Roll20Client:
                         """
                         clicked = await self.page.evaluate(click_script)
                         if clicked:
-                            print(f"  ✓ Clicked button")
+                            logger.debug(f"  ✓ Clicked button")
                             button_found = True
                             # Wait for redirect after clicking
-                            await asyncio.sleep(10)
+                            await self._wait_until(
+                                lambda: "setcampaign" not in self.page.url, timeout=10
+                            )
                             current_url = self.page.url
                             if "setcampaign" not in current_url:
-                                print(f"  ✓ Redirected to: {current_url}")
+                                logger.debug(f"  ✓ Redirected to: {current_url}")
                                 break
                 except Exception as e:
-                    print(f"  Error checking for '{button_text}': {e}")
+                    logger.warning(f"  Error checking for '{button_text}': {e}")
 
             if not button_found:
-                print("  No button found. The page might load the editor in place.")
-                print("  Continuing anyway - chat UI check will determine if we're ready.")
+                logger.info("  No button found. The page might load the editor in place.")
+                logger.info("  Continuing anyway - chat UI check will determine if we're ready.")
 
         elif "editor" not in current_url or "/login" in current_url:
             raise Exception(f"Editor did not load. Current URL: {current_url}")
         else:
-            print(f"✓ Successfully redirected to editor: {current_url}")
+            logger.info(f"✓ Successfully redirected to editor: {current_url}")
+
+        # Install the shared DOM bridge so subsequent element waits reuse one
+        # page-level MutationObserver instead of instrumenting the editor's
+        # subtree per wait
+        await self._install_dom_bridge()
 
         self._game_loaded = True
-        print("✓ Game loaded successfully!")
+        logger.info("✓ Game loaded successfully!")
+
+
+    # Page bootstrap installed once per editor page. It is a static string
+    # (built at import, never re-escaped per call) that provides:
+    #   - window.__r20WaitFor: a shared-MutationObserver element wait, so
+    #     each wait_for() call costs one CDP round-trip instead of
+    #     re-instrumenting the editor's heavy DOM subtree
+    #   - window.__r20: named helpers (sendWhisper, selectLastSpeaker,
+    #     checkChatUI) so the hot paths evaluate a short call expression
+    #     instead of shipping a whole function body over CDP each time
+    _DOM_BRIDGE_SCRIPT = """
+        (function() {
+            if (window.__r20WaitFor) return;
+            var seen = new Set();
+            var waiters = [];
+            var flush = function() {
+                waiters = waiters.filter(function(w) {
+                    if (document.querySelector(w.selector)) {
+                        seen.add(w.selector);
+                        clearTimeout(w.timer);
+                        w.resolve(true);
+                        return false;
+                    }
+                    return true;
+                });
+            };
+            var observer = new MutationObserver(flush);
+            observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true });
+            window.__r20WaitFor = function(selector, timeoutMs) {
+                return new Promise(function(resolve) {
+                    // Fast path: selector already observed or already present
+                    if (seen.has(selector) || document.querySelector(selector)) {
+                        seen.add(selector);
+                        resolve(true);
+                        return;
+                    }
+                    var w = { selector: selector, resolve: resolve };
+                    w.timer = setTimeout(function() {
+                        waiters = waiters.filter(function(x) { return x !== w; });
+                        resolve(false);
+                    }, timeoutMs);
+                    waiters.push(w);
+                });
+            };
+
+            window.__r20 = {
+                // Put a whisper in the chat textarea and click send, using
+                // cached element handles that are re-bound only if stale
+                sendWhisper: function(message) {
+                    var textarea = window.__r20_ta;
+                    var sendBtn = window.__r20_btn;
+                    if (!textarea || !textarea.isConnected || !sendBtn || !sendBtn.isConnected) {
+                        textarea = window.__r20_ta = document.querySelector('#textchat-input textarea');
+                        sendBtn = window.__r20_btn = document.getElementById('chatSendBtn');
+                    }
+                    if (!textarea) { throw new Error('Could not find chat textarea'); }
+                    if (!sendBtn) { throw new Error('Could not find send button'); }
+                    textarea.value = message;
+                    sendBtn.click();
+                },
+
+                // Select the last option of the "speaking as" dropdown
+                selectLastSpeaker: function() {
+                    var select = document.getElementById('speakingas');
+                    if (!select) {
+                        return { success: false, error: 'Dropdown not found' };
+                    }
+                    var options = select.options;
+                    if (!options || options.length === 0) {
+                        return { success: false, error: 'No options found' };
+                    }
+                    var lastOption = options[options.length - 1];
+                    select.value = lastOption.value;
+                    select.dispatchEvent(new Event('change', { bubbles: true }));
+                    if (window.jQuery) {
+                        jQuery(select).trigger('change');
+                    }
+                    return {
+                        success: true,
+                        value: lastOption.value,
+                        text: lastOption.text,
+                        optionCount: options.length
+                    };
+                },
+
+                // Resolve once every chat UI element exists; reject with the
+                // missing selectors on timeout
+                checkChatUI: function(timeoutMs) {
+                    var sels = ['#textchat-input', '#textchat-input textarea', '#speakingas', '#chatSendBtn'];
+                    return new Promise(function(resolve, reject) {
+                        var check = function() {
+                            return sels.every(function(s) { return document.querySelector(s); });
+                        };
+                        if (check()) {
+                            resolve(true);
+                            return;
+                        }
+                        var timer = null;
+                        var obs = new MutationObserver(function() {
+                            if (check()) {
+                                obs.disconnect();
+                                clearTimeout(timer);
+                                resolve(true);
+                            }
+                        });
+                        timer = setTimeout(function() {
+                            obs.disconnect();
+                            var missing = sels.filter(function(s) { return !document.querySelector(s); });
+                            reject(new Error('Missing elements: ' + missing.join(', ')));
+                        }, timeoutMs);
+                        obs.observe(document.documentElement, { childList: true, subtree: true });
+                    });
+                }
+            };
+        })()
+    """
 
+    async def _install_dom_bridge(self):
+        """Install the shared MutationObserver bridge on the current page."""
+        try:
+            await self.page.evaluate(self._DOM_BRIDGE_SCRIPT)
+        except Exception as e:
+            logger.debug(f"Could not install DOM bridge: {e}")
 
-    async def _dismiss_dialog_with_retry(self, dialog_name: str, content_selector: str, button_selector: str, max_attempts: int = 15):
+    async def wait_for(self, selector: str, timeout_ms: int = 10000) -> bool:
         """
-        Dismiss a dialog with retry logic.
+        Wait for a selector to appear, using the shared DOM bridge.
 
         Args:
-            dialog_name: Name of the dialog for logging
-            content_selector: Selector for the dialog content to wait for
-            button_selector: Selector for the button to click
-            max_attempts: Maximum number of attempts (default 15, increased for headless mode)
-        """
-        for attempt in range(max_attempts):
-            try:
-                # (a) Wait for the content to appear
-                print(f"  [{dialog_name}] Attempt {attempt + 1}/{max_attempts}: Waiting for dialog to appear...")
-                content = None
-                for wait_attempt in range(10):  # Wait up to 10 seconds
-                    content = await self.page.select(content_selector)
-                    if content:
-                        break
-                    await asyncio.sleep(1)
-
-                if not content:
-                    if attempt < max_attempts - 1:
-                        print(f"  [{dialog_name}] Dialog did not appear, retrying...")
-                        continue
-                    else:
-                        print(f"  [{dialog_name}] Dialog did not appear after {max_attempts} attempts, skipping")
-                        return
-
-                print(f"  [{dialog_name}] ✓ Dialog appeared")
-
-                # (b) Wait for the target button to be clickable
-                button = None
-                for wait_attempt in range(5):  # Wait up to 5 seconds
-                    button = await self.page.select(button_selector)
-                    if button:
-                        break
-                    await asyncio.sleep(1)
-
-                if not button:
-                    print(f"  [{dialog_name}] Button not found, retrying...")
-                    continue
-
-                print(f"  [{dialog_name}] ✓ Button found and clickable")
-
-                # (c) Click it
-                await button.click()
-                print(f"  [{dialog_name}] ✓ Clicked button")
-                await asyncio.sleep(0.5)
-                
-                # Dialog should dismiss - stop retrying
-                print(f"  [{dialog_name}] ✓ Button clicked, assuming dialog will dismiss")
-                return
-                
-            except Exception as e:
-                print(f"  [{dialog_name}] Error: {e}")
-                if attempt < max_attempts - 1:
-                    print(f"  [{dialog_name}] Retrying...")
-                    await asyncio.sleep(1)
-
-        print(f"  [{dialog_name}] Failed to dismiss after {max_attempts} attempts")
-
-    async def dismiss_dialogs(self):
-        """Dismiss various dialogs that may appear after game loads."""
-        print("\nDismissing post-load dialogs (in background)...")
-
-        # Start both dialog dismissal tasks in parallel immediately
-        skip_tour_task = asyncio.create_task(
-            self._dismiss_dialog_with_retry(
-                "Skip Tour",
-                ".shepherd-element",  # The tour dialog container
-                "button.shepherd-button-secondary"  # The skip button
-            )
-        )
+            selector: CSS selector to wait for
+            timeout_ms: Maximum time to wait in milliseconds
 
-        welcome_modal_task = asyncio.create_task(
-            self._dismiss_dialog_with_retry(
-                "Welcome Modal",
-                ".ui-dialog",  # The modal dialog container
-                ".ui-dialog-titlebar-close"  # The close button
-            )
+        Returns:
+            True if the selector appeared within the timeout, False otherwise
+        """
+        # (Re)install the bridge if the page navigated since launch
+        await self._install_dom_bridge()
+        result = await self.page.evaluate(
+            f"window.__r20WaitFor({json.dumps(selector)}, {int(timeout_ms)})",
+            await_promise=True,
         )
+        return bool(result)
 
-        # Wait for both tasks to complete
-        await asyncio.gather(skip_tour_task, welcome_modal_task)
-
-        print("✓ Dialog dismissal complete")
+    # Post-load dialogs to dismiss, as (name, content selector, button
+    # selector). All of them are watched by the single observer in
+    # dismiss_dialogs.
+    _DIALOGS = (
+        ("tour", ".shepherd-element", "button.shepherd-button-secondary"),
+        ("modal", ".ui-dialog", ".ui-dialog-titlebar-close"),
+    )
 
-    async def setup_chat_interface(self):
-        """Set up the chat interface by selecting the last character."""
-        print("\nSetting up chat interface...")
-
-        # Use JavaScript to get dropdown options and select the last one
-        print("Selecting last character from dropdown...")
+    async def dismiss_dialogs(self, overall_timeout_s: float = 10.0):
+        """
+        Dismiss the post-load dialogs (tour prompt, welcome modal).
 
-        script = """
-            (function() {
-                var select = document.getElementById("speakingas");
-                if (!select) {
-                    return { success: false, error: "Dropdown not found" };
-                }
+        One page.evaluate installs a single MutationObserver that watches for
+        every known dialog at once, clicks each dismiss button the moment it
+        appears, and then waits for the dialog node to leave the DOM before
+        counting it as handled. The promise resolves once every dialog is
+        gone (or the budget runs out, since most runs the dialogs never
+        appear at all). The whole pass is one CDP round-trip regardless of
+        dialog count.
 
-                var options = select.options;
-                if (!options || options.length === 0) {
-                    return { success: false, error: "No options found" };
-                }
+        Args:
+            overall_timeout_s: Total time budget shared by all dialog waits
+        """
+        logger.info("\nDismissing post-load dialogs (in background)...")
 
-                // Get the last option
-                var lastOption = options[options.length - 1];
-                var lastValue = lastOption.value;
-                var lastText = lastOption.text;
+        overall_timeout_s = self._startup_time_left(overall_timeout_s)
+        timeout_ms = int(overall_timeout_s * 1000)
+        dialogs_json = json.dumps(
+            [{"name": n, "content": c, "button": b} for n, c, b in self._DIALOGS]
+        )
+        script = f"""
+            new Promise((resolve) => {{
+                var dialogs = {dialogs_json};
+                var done = {{}};
+                dialogs.forEach(function(d) {{ done[d.name] = 'pending'; }});
+
+                var allDone = function() {{
+                    return dialogs.every(function(d) {{ return done[d.name] === 'removed'; }});
+                }};
+                var sweep = function() {{
+                    dialogs.forEach(function(d) {{
+                        if (done[d.name] === 'removed') return;
+                        var content = document.querySelector(d.content);
+                        // After the click, wait for the dialog node to
+                        // actually leave the DOM rather than assuming it
+                        // will; the observer fires again on its removal.
+                        if (done[d.name] === 'clicked') {{
+                            if (!content) {{ done[d.name] = 'removed'; }}
+                            return;
+                        }}
+                        if (!content) return;
+                        var button = document.querySelector(d.button);
+                        if (!button) return;
+                        button.click();
+                        done[d.name] = document.querySelector(d.content) ? 'clicked' : 'removed';
+                    }});
+                }};
+
+                // Fast path: dialogs may already be on screen
+                sweep();
+                if (allDone()) {{
+                    resolve(done);
+                    return;
+                }}
+
+                var timer = null;
+                var observer = new MutationObserver(function() {{
+                    sweep();
+                    if (allDone()) {{
+                        observer.disconnect();
+                        clearTimeout(timer);
+                        resolve(done);
+                    }}
+                }});
+                timer = setTimeout(function() {{
+                    observer.disconnect();
+                    resolve(done);
+                }}, {timeout_ms});
+                observer.observe(document.documentElement, {{ childList: true, subtree: true }});
+            }})
+        """
 
-                // Select it
-                select.value = lastValue;
+        try:
+            result = await asyncio.wait_for(
+                self.page.evaluate(script, await_promise=True),
+                timeout=overall_timeout_s + 1.0,  # small grace for the CDP round-trip
+            )
+            for name, status in (result or {}).items():
+                if status == 'removed':
+                    logger.debug(f"  [{name}] ✓ Dialog dismissed and removed from the DOM")
+                elif status == 'clicked':
+                    logger.debug(f"  [{name}] Dismiss button clicked but dialog still present at timeout")
+                else:
+                    logger.debug(f"  [{name}] Dialog did not appear within {overall_timeout_s:.0f}s, skipping")
+        except asyncio.TimeoutError:
+            logger.debug(f"Dialog dismissal did not finish within {overall_timeout_s:.0f}s, moving on")
+        except Exception as e:
+            logger.warning(f"  Dialog dismissal error: {e}")
 
-                // Trigger change event
-                var event = new Event('change', { bubbles: true });
-                select.dispatchEvent(event);
+        logger.info("✓ Dialog dismissal complete")
 
-                // Also try jQuery if available
-                if (window.jQuery) {
-                    jQuery(select).trigger('change');
-                }
+    async def setup_chat_interface(self):
+        """Set up the chat interface by selecting the last character."""
+        logger.info("\nSetting up chat interface...")
 
-                return {
-                    success: true,
-                    value: lastValue,
-                    text: lastText,
-                    optionCount: options.length
-                };
-            })()
-        """
+        # Use the pre-installed page helper to select the last option.
+        # The speaker selection and the element-handle caching below are
+        # independent CDP calls, so fire them together and let their
+        # round-trip latencies overlap instead of stacking.
+        logger.info("Selecting last character from dropdown...")
 
         try:
-            result = await self.page.evaluate(script)
+            await self._install_dom_bridge()
+            result, _ = await asyncio.gather(
+                self.page.evaluate("window.__r20.selectLastSpeaker()"),
+                self.page.evaluate(
+                    'window.__r20_ta = document.querySelector("#textchat-input textarea");'
+                    'window.__r20_btn = document.getElementById("chatSendBtn");'
+                ),
+            )
             if result.get('success'):
-                print(f"  ✓ Found {result.get('optionCount')} options")
-                print(f"  ✓ Selected: {result.get('text')}")
+                logger.debug(f"  ✓ Found {result.get('optionCount')} options")
+                logger.info(f"  ✓ Selected: {result.get('text')}")
             else:
-                print(f"  Warning: {result.get('error')}")
-                print(f"  Continuing anyway - default selection may be fine")
+                logger.warning(f"  Warning: {result.get('error')}")
+                logger.info("  Continuing anyway - default selection may be fine")
         except Exception as e:
-            print(f"  Warning: Could not select dropdown option: {e}")
-            print(f"  Continuing anyway - default selection may be fine")
+            logger.warning(f"  Warning: Could not select dropdown option: {e}")
+            logger.info("  Continuing anyway - default selection may be fine")
 
-        print("\n✓ Chat interface ready!")
+        # Cache the Python-side chat element handles (the in-page
+        # window.__r20_* cache was populated above). The three lookups are
+        # independent, so they run concurrently.
+        try:
+            (
+                self.chat_textarea,
+                self.chat_send_button,
+                self.speaking_as_dropdown,
+            ) = await asyncio.gather(
+                self.page.select("#textchat-input textarea", timeout=1),
+                self.page.select("#chatSendBtn", timeout=1),
+                self.page.select("#speakingas", timeout=1),
+            )
+        except Exception as e:
+            logger.debug(f"  Could not cache chat element handles: {e}")
 
-    async def verify_chat_ui(self):
-        """Verify that the chat UI elements are present, with retries."""
-        print("\nVerifying chat UI elements...")
-        print("(This may take a while as the page finishes loading...)")
+        logger.info("\n✓ Chat interface ready!")
 
-        # Use JavaScript to check for elements - much faster and more reliable
-        # Try multiple times with shorter waits
-        # Increased for headless mode where things can be slower to render
-        max_attempts = 40
-        for attempt in range(max_attempts):
-            try:
-                # Check each element individually using JavaScript
-                chat_input_exists = await self.page.evaluate('!!document.querySelector("#textchat-input")')
-                textarea_exists = await self.page.evaluate('!!document.querySelector("#textchat-input textarea")')
-                speaking_as_exists = await self.page.evaluate('!!document.querySelector("#speakingas")')
-                send_btn_exists = await self.page.evaluate('!!document.querySelector("#chatSendBtn")')
-
-                all_found = chat_input_exists and textarea_exists and speaking_as_exists and send_btn_exists
-
-                if all_found:
-                    # All elements found!
-                    print("  ✓ Found #textchat-input")
-                    print("  ✓ Found textarea")
-                    print("  ✓ Found #speakingas dropdown")
-                    print("  ✓ Found #chatSendBtn")
-                    print("\n✓ All chat UI elements verified!")
-                    return True
-                else:
-                    # Show which elements are missing
-                    missing = []
-                    if not chat_input_exists: missing.append('#textchat-input')
-                    if not textarea_exists: missing.append('textarea')
-                    if not speaking_as_exists: missing.append('#speakingas')
-                    if not send_btn_exists: missing.append('#chatSendBtn')
-
-                    if attempt < max_attempts - 1:
-                        print(f"  Attempt {attempt + 1}/{max_attempts}: Missing {', '.join(missing)}, waiting 1 second...")
-                        await asyncio.sleep(1)
-                    else:
-                        raise Exception(f"Missing elements: {', '.join(missing)}")
+    async def verify_chat_ui(self, timeout_s: float = 40.0):
+        """
+        Verify that the chat UI elements are present.
 
-            except Exception as e:
-                if attempt < max_attempts - 1:
-                    print(f"  Attempt {attempt + 1}/{max_attempts}: Error checking UI: {e}, waiting 1 second...")
-                    await asyncio.sleep(1)
-                else:
-                    # Last attempt failed
-                    raise Exception(f"Chat UI elements not found after {max_attempts} attempts: {e}")
+        The editor mounts the chat elements in a burst once React/jQuery
+        finish, so rather than polling from Python (4 CDP round-trips per
+        second for up to 40s), the pre-installed window.__r20.checkChatUI
+        helper resolves the moment all four selectors exist. On timeout it
+        rejects with the selectors still missing.
+
+        Args:
+            timeout_s: How long to wait for the chat UI before failing
+        """
+        logger.info("\nVerifying chat UI elements...")
+        logger.info("(This may take a while as the page finishes loading...)")
+
+        timeout_s = self._startup_time_left(timeout_s)
+        timeout_ms = int(timeout_s * 1000)
+        try:
+            await self._install_dom_bridge()
+            await self.page.evaluate(
+                f"window.__r20.checkChatUI({timeout_ms})", await_promise=True
+            )
+        except Exception as e:
+            raise Exception(f"Chat UI elements not found after {timeout_s:.0f}s: {e}")
 
+        logger.info("\n✓ All chat UI elements verified!")
         return True
 
     async def initialize(self, headless: bool = False):
@@ -638,11 +969,20 @@ class Roll20Client:
             if not already_logged_in:
                 await self.login()
 
-            await self.login()
-
             await self.launch_game()
 
-            # Start dismissing dialogs in the background (don't wait for it)
+            # One deadline bounds the whole post-launch phase: the chat UI
+            # wait and the dialog observers below all draw from it
+            self._startup_deadline = (
+                asyncio.get_running_loop().time() + self.STARTUP_BUDGET_S
+            )
+
+            # Dismiss dialogs concurrently with the chat UI verification -
+            # both are just waiting on the same page load. When no dialog
+            # ever appears (the common case) the in-page promise only
+            # resolves at its full budget, so startup never awaits the
+            # task; it's tracked immediately so close() can reap it even
+            # if one of the awaits below raises.
             dialog_task = asyncio.create_task(self.dismiss_dialogs())
             self._background_tasks.append(dialog_task)
 
@@ -651,33 +991,39 @@ class Roll20Client:
             # Set up chat interface immediately - dialogs can continue dismissing in background
             await self.setup_chat_interface()
 
-            print("\n" + "=" * 60)
-            print("✅ Roll20 client fully initialized and ready!")
-            print("=" * 60)
+            self._startup_deadline = None
+
+            logger.info("\n" + "=" * 60)
+            logger.info("✅ Roll20 client fully initialized and ready!")
+            logger.info("=" * 60)
 
         except Exception as e:
-            print("\n" + "=" * 60)
-            print("❌ INITIALIZATION FAILED")
-            print("=" * 60)
-            print(f"Error: {e}")
+            logger.info("\n" + "=" * 60)
+            logger.error("❌ INITIALIZATION FAILED")
+            logger.info("=" * 60)
+            logger.error(f"Error: {e}")
 
             # Capture screenshot and DOM on failure (especially useful in headless mode)
             if self.page:
-                print("\nAttempting to capture screenshot and DOM for debugging...")
+                logger.info("\nAttempting to capture screenshot and DOM for debugging...")
 
                 # Capture both screenshot and DOM with same timestamp
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-                screenshot_path = await self.capture_screenshot(f"roll20_error_{timestamp}.png")
-                dom_path = await self.capture_dom(f"roll20_error_{timestamp}.html")
+                # Independent diagnostics: let the screenshot encode and the
+                # DOM fetch overlap rather than paying both latencies in turn
+                screenshot_path, dom_path = await asyncio.gather(
+                    self.capture_screenshot(f"roll20_error_{timestamp}.png"),
+                    self.capture_dom(f"roll20_error_{timestamp}.html"),
+                )
 
                 if screenshot_path:
-                    print(f"Screenshot saved to: {screenshot_path}")
+                    logger.info(f"Screenshot saved to: {screenshot_path}")
                 if dom_path:
-                    print(f"DOM saved to: {dom_path}")
+                    logger.info(f"DOM saved to: {dom_path}")
 
                 if screenshot_path or dom_path:
-                    print("These can help diagnose what went wrong in headless mode.")
+                    logger.info("These can help diagnose what went wrong in headless mode.")
 
             # Re-raise the exception so caller knows initialization failed
             raise
@@ -685,18 +1031,18 @@ class Roll20Client:
     async def close(self):
         """Close the browser gracefully."""
         if self.browser:
-            print("\nClosing browser gracefully...")
+            logger.info("\nClosing browser gracefully...")
             try:
                 # Cancel any background tasks first
                 if self._background_tasks:
-                    print("  Cancelling background tasks...")
+                    logger.debug("  Cancelling background tasks...")
                     for task in self._background_tasks:
                         if not task.done():
                             task.cancel()
                     # Wait for tasks to be cancelled
                     await asyncio.gather(*self._background_tasks, return_exceptions=True)
                     self._background_tasks.clear()
-                    print("  ✓ Background tasks cancelled")
+                    logger.debug("  ✓ Background tasks cancelled")
                 
                 # Give the browser a moment to finish any pending operations
                 await asyncio.sleep(0.5)
@@ -705,23 +1051,36 @@ class Roll20Client:
                 if self.page:
                     try:
                         await self.page.close()
-                        print("  ✓ Page closed")
+                        logger.debug("  ✓ Page closed")
                     except Exception as e:
-                        print(f"  Note: Could not close page gracefully: {e}")
+                        logger.debug(f"  Note: Could not close page gracefully: {e}")
                 
                 # Give browser time to process the page close
                 await asyncio.sleep(0.5)
-                
-                # Now stop the browser
-                # browser.stop() is not async in nodriver, just call it directly
-                self.browser.stop()
-                print("  ✓ Browser stopped")
-                
+
+                # Park a healthy browser in the pool for the next session
+                # instead of stopping it; atexit stops whatever is left.
+                # Externally managed browsers are simply detached from: their
+                # lifecycle belongs to whoever launched them.
+                if self._external_browser:
+                    logger.debug("  ✓ Detached from external browser")
+                elif self._user_data_dir is not None and getattr(self.browser, 'stopped', True) is False:
+                    async with _browser_pool_lock:
+                        _browser_pool[(self._headless, self._user_data_dir)] = self.browser
+                    logger.debug("  ✓ Browser returned to pool")
+                else:
+                    # browser.stop() is not async in nodriver, just call it directly
+                    self.browser.stop()
+                    logger.debug("  ✓ Browser stopped")
+
             except Exception as e:
-                print(f"  Error during browser shutdown: {e}")
+                logger.warning(f"  Error during browser shutdown: {e}")
             finally:
                 self.browser = None
                 self.page = None
+                self.chat_textarea = None
+                self.chat_send_button = None
+                self.speaking_as_dropdown = None
                 self._logged_in = False
                 self._game_loaded = False
-                print("  ✓ Browser cleanup complete")
+                logger.debug("  ✓ Browser cleanup complete")
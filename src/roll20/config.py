@@ -6,17 +6,27 @@ This module handles:
 - Browser automation settings
 """
 
+import functools
 import os
-from dotenv import load_dotenv
 
-# Load .env file
-load_dotenv()
+_env_loaded = False
+
+
+def _ensure_env() -> None:
+    """Load the .env file once, on first config construction."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
 
 
 class Roll20Config:
     """Configuration for Roll20 integration."""
 
     def __init__(self):
+        _ensure_env()
         self.username = os.getenv("ROLL20_USERNAME")
         self.password = os.getenv("ROLL20_PASSWORD")
         self.campaign_id = os.getenv("ROLL20_CAMPAIGN_ID")
@@ -25,6 +35,14 @@ class Roll20Config:
         target_users_str = os.getenv("ROLL20_TARGET_USERS", "")
         self.target_users = [u.strip() for u in target_users_str.split(",") if u.strip()]
 
+        # Operation timeouts (seconds). The editor timeout bounds the
+        # setcampaign -> editor redirect wait; the idle timeout, if set,
+        # bounds how long the message worker blocks on an empty queue
+        # (unset/0 = wait forever).
+        self.editor_load_timeout = float(os.getenv("ROLL20_EDITOR_TIMEOUT", "60"))
+        idle_timeout = float(os.getenv("ROLL20_IDLE_TIMEOUT", "0"))
+        self.idle_timeout = idle_timeout if idle_timeout > 0 else None
+
         # Validate required configuration
         if not self.username:
             raise ValueError("ROLL20_USERNAME environment variable is required")
@@ -44,6 +62,15 @@ class Roll20Config:
         return "https://app.roll20.net/sessions/new"
 
 
-# Global config instance
-config = Roll20Config()
+@functools.lru_cache(maxsize=1)
+def get_config() -> Roll20Config:
+    """
+    Get the shared Roll20Config instance, built on first use.
+
+    Building the config reads (and validates) the environment, so doing it
+    lazily keeps `import src.roll20` free of side effects: code that only
+    wants e.g. format_whisper never pays for — or trips over — missing
+    Roll20 credentials.
+    """
+    return Roll20Config()
 
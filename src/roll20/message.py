@@ -8,14 +8,17 @@ This module handles:
 
 import asyncio
 import json
+import logging
 from typing import TYPE_CHECKING
 
-from .verbose import vprint
+logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from .client import Roll20Client
 
 
+
+
 def format_whisper(username: str, message: str) -> str:
     """
     Format a whisper message for Roll20 chat.
@@ -41,41 +44,41 @@ async def send_message(client: "Roll20Client", username: str, message: str) -> N
         username: The Roll20 username to whisper to
         message: The message content
     """
-    formatted_message = format_whisper(username, message)
+    # Replace double-quotes with single-quotes to avoid confusing Roll20's parser
+    await send_prepared(client, username, message.replace('"', "'"))
+
+
+async def send_prepared(client: "Roll20Client", username: str, sanitized_message: str) -> None:
+    """
+    Send an already-sanitized whisper message to a user via Roll20 chat.
+
+    Callers fanning one message out to several users should sanitize it once
+    (see send_message) and call this per user, so the quote-replacement scan
+    runs once per message instead of once per recipient.
+
+    Args:
+        client: The Roll20Client instance with initialized chat interface
+        username: The Roll20 username to whisper to
+        sanitized_message: Message content with double-quotes already replaced
+    """
+    formatted_message = f'/w "{username}" {sanitized_message}'
 
-    vprint(f"\n[Message] Formatting and sending:")
-    vprint(f"  Username: {repr(username)}")
-    vprint(f"  Message: {repr(message)}")
-    vprint(f"  Formatted whisper: {repr(formatted_message)}")
+    # %r arguments are only formatted when DEBUG is enabled, so production
+    # runs pay no repr/allocation cost per message
+    logger.debug("\n[Message] Formatting and sending:")
+    logger.debug("  Username: %r", username)
+    logger.debug("  Formatted whisper: %r", formatted_message)
 
     # Use JavaScript to set the textarea value and click send
     # This is more reliable than using nodriver's DOM methods
-    vprint(f"  Setting textarea value and clicking send...")
-
-    # Escape backslashes and single quotes for JavaScript string literal
-    # We use single quotes in JS so we only need to escape single quotes and backslashes
-    js_safe_message = formatted_message.replace('\\', '\\\\').replace("'", "\\'")
-
-    script = f"""
-        // Get the textarea
-        var textarea = document.querySelector("#textchat-input textarea");
-        if (!textarea) {{
-            throw new Error("Could not find chat textarea");
-        }}
-
-        // Clear and set the value
-        textarea.value = "";
-        textarea.value = '{js_safe_message}';
-
-        // Click the send button
-        var sendBtn = document.getElementById("chatSendBtn");
-        if (!sendBtn) {{
-            throw new Error("Could not find send button");
-        }}
-        sendBtn.click();
-    """
+    logger.debug("  Setting textarea value and clicking send...")
 
-    await client.page.evaluate(script)
+    # The function body lives in the page bootstrap installed by the client;
+    # per message we only ship a short call expression. json.dumps produces a
+    # valid JS string literal, so embedded quotes can't break the script.
+    await client.page.evaluate(
+        "window.__r20.sendWhisper(%s)" % json.dumps(formatted_message)
+    )
 
-    vprint(f"  ✓ Message sent!")
+    logger.debug("  ✓ Message sent!")
 
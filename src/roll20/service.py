@@ -9,12 +9,38 @@ This module provides a high-level service interface for:
 """
 
 import asyncio
+import collections
+import logging
 from enum import Enum
 from typing import Optional
 
 from .client import Roll20Client
-from .message import send_message
-from .verbose import vprint
+from .config import get_config
+from .message import send_prepared
+
+logger = logging.getLogger(__name__)
+
+_UVLOOP_INSTALLED = False
+
+
+def install_uvloop():
+    """Install uvloop's event loop policy once, where available.
+
+    The service is entirely I/O-bound (CDP websocket traffic + queue waits),
+    so uvloop's faster loop is worth having — but install() only affects
+    loops created after it runs, so entry points must call this before
+    creating the loop that will drive the service (Roll20Worker.run, the
+    test scripts' __main__ blocks). It is deliberately not an import side
+    effect: policy mutation is process-wide."""
+    global _UVLOOP_INSTALLED
+    if _UVLOOP_INSTALLED:
+        return
+    _UVLOOP_INSTALLED = True
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
 
 
 class ServiceState(Enum):
@@ -38,11 +64,19 @@ class Roll20Service:
         await service.send(["Player1", "Player2"], "Hello!")
         await service.close()
     """
-    
+
+    # Maximum in-flight sends for a multi-user whisper. Drop to 1 if Roll20
+    # ever chokes on concurrent writes to the chat textarea.
+    SEND_CONCURRENCY = 4
+
     def __init__(self):
         self._client = Roll20Client()
         self._state = ServiceState.CLOSED
-        self._message_queue: asyncio.Queue[tuple[list[str], str]] = asyncio.Queue()
+        # A plain deque plus an Event is cheaper than asyncio.Queue for this
+        # single-producer/single-consumer setup: append/popleft are lock-free
+        # and the worker only touches the Event when the deque runs dry.
+        self._pending: collections.deque[tuple[list[str], str]] = collections.deque()
+        self._pending_event = asyncio.Event()
         self._worker_task: Optional[asyncio.Task] = None
     
     @property
@@ -71,7 +105,7 @@ class Roll20Service:
         if self._state != ServiceState.CLOSED:
             raise RuntimeError(f"Cannot open service in state {self._state.value}")
         
-        print("Opening Roll20 service...")
+        logger.info("Opening Roll20 service...")
         self._state = ServiceState.CONNECTING
         
         try:
@@ -82,11 +116,11 @@ class Roll20Service:
             self._worker_task = asyncio.create_task(self._process_queue())
             
             self._state = ServiceState.READY
-            print("✓ Roll20 service is ready!")
+            logger.info("✓ Roll20 service is ready!")
             
         except Exception as e:
             self._state = ServiceState.CLOSED
-            print(f"✗ Failed to open Roll20 service: {e}")
+            logger.error("✗ Failed to open Roll20 service: %s", e)
             raise
     
     async def send(self, to_users: list[str], message: str) -> None:
@@ -106,9 +140,10 @@ class Roll20Service:
         if self._state == ServiceState.CLOSED:
             raise RuntimeError("Cannot send message: service is closed")
         
-        # Queue the message for processing
-        await self._message_queue.put((to_users, message))
-        print(f"Queued message for {len(to_users)} user(s)")
+        # Queue the message for processing and wake the worker
+        self._pending.append((to_users, message))
+        self._pending_event.set()
+        logger.debug("Queued message for %d user(s)", len(to_users))
     
     async def close(self) -> None:
         """
@@ -120,10 +155,10 @@ class Roll20Service:
         3. Close the browser
         """
         if self._state == ServiceState.CLOSED:
-            print("Service already closed")
+            logger.info("Service already closed")
             return
         
-        print("Closing Roll20 service...")
+        logger.info("Closing Roll20 service...")
         self._state = ServiceState.CLOSED
         
         # Cancel the worker task
@@ -138,7 +173,7 @@ class Roll20Service:
         # Close the client
         await self._client.close()
         
-        print("✓ Roll20 service closed")
+        logger.info("✓ Roll20 service closed")
     
     async def _process_queue(self) -> None:
         """
@@ -147,36 +182,65 @@ class Roll20Service:
         This runs continuously, pulling messages from the queue
         and sending them to the specified users.
         """
-        print("Message processing worker started")
+        logger.debug("Message processing worker started")
         
         try:
             while True:
-                # Wait for a message from the queue
-                to_users, message = await self._message_queue.get()
+                # Sleep until send() signals new work. An optional idle timeout
+                # (ROLL20_IDLE_TIMEOUT) keeps a wedged CDP socket from hanging
+                # the worker forever; on timeout we just loop and wait again.
+                if not self._pending:
+                    try:
+                        await asyncio.wait_for(
+                            self._pending_event.wait(), timeout=get_config().idle_timeout
+                        )
+                    except asyncio.TimeoutError:
+                        logger.debug("[Service] No messages within idle timeout, still alive")
+                        continue
+                self._pending_event.clear()
+                if not self._pending:
+                    continue
+
+                # Drain everything queued since the last wakeup and group the
+                # messages by recipient: a user who has N messages waiting
+                # gets one newline-joined whisper instead of N separate
+                # textarea round-trips, and each user is still one send.
+                per_user: dict[str, list[str]] = {}
+                while self._pending:
+                    to_users, message = self._pending.popleft()
+                    # Sanitize once per message, not once per recipient
+                    sanitized = message.replace('"', "'")
+                    for username in to_users:
+                        per_user.setdefault(username, []).append(sanitized)
 
-                vprint(f"\n[Service] Processing queued message:")
-                vprint(f"  To users: {to_users}")
-                vprint(f"  Message: {repr(message)}")
+                logger.debug("\n[Service] Processing queued batch:")
+                logger.debug("  To users: %s", list(per_user))
 
                 # Transition to Sending state
                 self._state = ServiceState.SENDING
 
-                # Send the message to each user
-                for username in to_users:
-                    vprint(f"\n[Service] Sending to user '{username}'...")
-                    await send_message(self._client, username, message)
-                    vprint(f"  ✓ Sent to {username}")
-                
-                # Mark the task as done
-                self._message_queue.task_done()
-                
+                # Send to all users concurrently; each send is one CDP
+                # round-trip, so a multi-user whisper has no reason to
+                # serialize. The semaphore bounds in-flight sends.
+                sem = asyncio.Semaphore(self.SEND_CONCURRENCY)
+
+                async def _send_one(username: str, text: str) -> None:
+                    async with sem:
+                        logger.debug("\n[Service] Sending to user '%s'...", username)
+                        await send_prepared(self._client, username, text)
+                        logger.debug("  ✓ Sent to %s", username)
+
+                await asyncio.gather(
+                    *[_send_one(u, "\n".join(msgs)) for u, msgs in per_user.items()]
+                )
+
                 # Transition back to Ready state
                 self._state = ServiceState.READY
                 
         except asyncio.CancelledError:
-            print("Message processing worker cancelled")
+            logger.debug("Message processing worker cancelled")
             raise
         except Exception as e:
-            print(f"Error in message processing worker: {e}")
+            logger.error("Error in message processing worker: %s", e)
             # Continue processing despite errors
 
@@ -13,31 +13,22 @@ Usage:
 """
 
 import asyncio
-import sys
+from ._test_common import HEADLESS, inspection_wait, print_banner, setup_logging
 from .client import Roll20Client
+from .service import install_uvloop
 
 
 async def main():
     """Test the Roll20 client initialization."""
-    
-    # Parse command line arguments - default is headful now
-    headless = False
-    if "--headless" in sys.argv:
-        headless = True
+
+    # Mode parsing and banner printing are shared across the test scripts
+    headless = HEADLESS
+    setup_logging()
 
     client = Roll20Client()
 
     try:
-        print("=" * 60)
-        print("Roll20 Client Test")
-        print("=" * 60)
-
-        if headless:
-            print("\nRunning in HEADLESS mode")
-            print("Note: Cloudflare may block headless browsers.\n")
-        else:
-            print("\nRunning in HEADFUL mode (browser visible)")
-            print("If Cloudflare challenges appear, complete them manually.\n")
+        print_banner("Roll20 Client Test")
         
         # Initialize the client (this does everything)
         await client.initialize(headless=headless)
@@ -52,8 +43,8 @@ async def main():
         
         print("Press Ctrl+C to close early.\n")
         
-        # Keep the browser open for inspection
-        await asyncio.sleep(wait_time)
+        # Keep the browser open for inspection; Ctrl+C ends the wait at once
+        await inspection_wait(wait_time)
         
     except KeyboardInterrupt:
         print("\nTest interrupted by user")
@@ -67,5 +58,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()  # before asyncio.run creates the loop
     asyncio.run(main())
 
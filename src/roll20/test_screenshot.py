@@ -9,16 +9,19 @@ Usage:
 """
 
 import asyncio
+from ._test_common import print_banner, setup_logging
 from .client import Roll20Client
+from .service import install_uvloop
 
 
 async def main():
     """Test screenshot capture on failure."""
-    
-    print("=" * 60)
-    print("Roll20 Screenshot Capture Test")
-    print("=" * 60)
-    print("\nThis test will attempt to initialize in headless mode.")
+
+    setup_logging()
+
+    # This script always runs headless; it exercises the failure diagnostics
+    print_banner("Roll20 Screenshot Capture Test", headless=True)
+    print("This test will attempt to initialize in headless mode.")
     print("If initialization fails, a screenshot will be captured.\n")
     
     client = Roll20Client()
@@ -44,5 +47,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()  # before asyncio.run creates the loop
     asyncio.run(main())
 
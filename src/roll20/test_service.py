@@ -12,31 +12,38 @@ Usage:
 """
 
 import asyncio
-import sys
-from .service import Roll20Service
+from ._test_common import HEADLESS, inspection_wait, print_banner, setup_logging
+from .service import Roll20Service, install_uvloop
+
+
+async def _wait_until_sent(service: Roll20Service, timeout: float = 5.0) -> None:
+    """Wait until the queue has drained and the service is Ready again (bounded).
+
+    send() queues without yielding to the loop, so right after it returns
+    the state is still Ready and the worker hasn't woken — "back to Ready"
+    alone would be satisfied vacuously. Yield once to let the worker wake,
+    then poll until the deque is empty and the state has settled.
+    """
+    await asyncio.sleep(0)
+    deadline = asyncio.get_event_loop().time() + timeout
+    while (
+        (service._pending or service.state.value != "Ready")
+        and asyncio.get_event_loop().time() < deadline
+    ):
+        await asyncio.sleep(0.1)
 
 
 async def main():
     """Test the Roll20 service."""
-    
-    # Parse command line arguments - default is headful now
-    headless = False
-    if "--headless" in sys.argv:
-        headless = True
+
+    # Mode parsing and banner printing are shared across the test scripts
+    headless = HEADLESS
+    setup_logging()
 
     service = Roll20Service()
 
     try:
-        print("=" * 60)
-        print("Roll20 Service Test")
-        print("=" * 60)
-
-        if headless:
-            print("\nRunning in HEADLESS mode")
-            print("Note: Cloudflare may block headless browsers.\n")
-        else:
-            print("\nRunning in HEADFUL mode (browser visible)")
-            print("If Cloudflare challenges appear, complete them manually.\n")
+        print_banner("Roll20 Service Test")
         
         # Open the service
         print("Opening service...")
@@ -56,9 +63,9 @@ async def main():
         
         print(f"\nMessage queued. Service state: {service.state.value}")
         
-        # Wait a bit for the message to be sent
+        # Wait until the worker has actually sent it (bounded at 5s)
         print("\nWaiting for messages to be sent...")
-        await asyncio.sleep(5)
+        await _wait_until_sent(service)
         
         print(f"Service state: {service.state.value}")
         
@@ -67,7 +74,7 @@ async def main():
         await service.send(test_users, "Second test message!")
         
         # Wait for it to be sent
-        await asyncio.sleep(5)
+        await _wait_until_sent(service)
         
         # Different wait times for headless vs headful
         if headless:
@@ -79,8 +86,8 @@ async def main():
         
         print("Press Ctrl+C to close early.\n")
         
-        # Keep the browser open for inspection
-        await asyncio.sleep(wait_time)
+        # Keep the browser open for inspection; Ctrl+C ends the wait at once
+        await inspection_wait(wait_time)
         
     except KeyboardInterrupt:
         print("\nTest interrupted by user")
@@ -94,5 +101,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()  # before asyncio.run creates the loop
     asyncio.run(main())
 
@@ -5,10 +5,22 @@ This module provides a simple way to control verbose debug output
 across the Roll20 integration components.
 """
 
-# Global verbose flag
+# Global verbose flag (kept for introspection; vprint no longer reads it
+# per call)
 VERBOSE = False
 
 
+def _noop(*args, **kwargs) -> None:
+    """Placeholder for vprint while verbose mode is off."""
+
+
+# vprint is rebound by set_verbose: a real print when verbose, a bare no-op
+# otherwise, so the off path costs one empty call instead of a global load
+# and truthiness test every time. Call it as verbose.vprint(...) — a
+# from-import freezes whichever binding was current at import time.
+vprint = _noop
+
+
 def set_verbose(enabled: bool) -> None:
     """
     Enable or disable verbose logging.
@@ -16,18 +28,6 @@ def set_verbose(enabled: bool) -> None:
     Args:
         enabled: True to enable verbose output, False to disable
     """
-    global VERBOSE
+    global VERBOSE, vprint
     VERBOSE = enabled
-
-
-def vprint(*args, **kwargs) -> None:
-    """
-    Print only if verbose mode is enabled.
-    
-    Usage: Same as print()
-        vprint("Debug message")
-        vprint(f"Value: {value}")
-    """
-    if VERBOSE:
-        print(*args, **kwargs)
-
+    vprint = print if enabled else _noop
@@ -0,0 +1,34 @@
+"""Stubs shared by the unit tests.
+
+src.input.ui imports sounddevice and soundfile at module level, which
+loads the PortAudio/libsndfile native libraries and probes the audio
+host — real wall time (and a hard failure on machines with no audio
+stack) for tests that mock every playback call anyway. Pre-stubbing the
+modules here runs before any unit test module is imported, so
+`import sounddevice as sd` in ui.py binds the stand-in and patches like
+`src.input.ui.sd.play` keep working. The integration tests under
+tests/integration are outside this conftest and still get the real
+libraries.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+for _name in ("sounddevice", "soundfile"):
+    if _name not in sys.modules:
+        sys.modules[_name] = MagicMock()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config_dir(tmp_path, monkeypatch):
+    """Keep unit tests away from the user's real settings/history files.
+
+    HutteseUI loads and saves history through src.config.settings; without
+    this, a test that appends history would leak entries into the real
+    config dir and poison later runs' fresh-construction assertions.
+    """
+    from src.config import settings
+
+    monkeypatch.setattr(settings, "get_config_dir", lambda: tmp_path)
@@ -0,0 +1,21 @@
+"""Shared fixtures for the audio unit tests."""
+
+from functools import lru_cache
+
+import pytest
+
+from src.audio.translation import rewrite_to_huttese
+
+
+@pytest.fixture(scope="session")
+def rewrite_cache():
+    """Memoized rewrite_to_huttese shared across the whole test session.
+
+    The rewrite is deterministic for a given (text, seed, flags) tuple, so
+    tests that probe different properties of the same input can reuse one
+    result instead of re-running the pipeline. Arguments must be hashable —
+    pass literal_phrases as a tuple. Tests asserting determinism itself
+    should call rewrite_to_huttese directly, since a cached second call
+    would make that assertion vacuous.
+    """
+    return lru_cache(maxsize=256)(rewrite_to_huttese)
@@ -1,7 +1,7 @@
 from src.audio.translation import rewrite_to_huttese
 
-def test_basic():
-    out = rewrite_to_huttese("Bring me the plans, quickly!", seed=1)
+def test_basic(rewrite_cache):
+    out = rewrite_cache("Bring me the plans, quickly!", seed=1)
     assert isinstance(out, str)
     assert len(out) > 0
 
@@ -20,32 +20,29 @@ def test_different_seeds():
 
 
 
-def test_quoted_text_preserved():
+def test_quoted_text_preserved(rewrite_cache):
     """Test that text in double quotes is preserved as-is."""
-    from src.audio.translation import rewrite_to_huttese
-    
     # Note: Single quotes are NOT treated as literal markers (they're used for contractions)
     # Only double quotes preserve text
     
     # Double quotes
-    result = rewrite_to_huttese('The droid named "R2-D2" is here', seed=42)
+    result = rewrite_cache('The droid named "R2-D2" is here', seed=42)
     assert "R2-D2" in result  # Should preserve R2-D2 exactly
     
     # Multiple double-quoted sections
-    result = rewrite_to_huttese('Tell "Han" that "Leia" is waiting', seed=42)
+    result = rewrite_cache('Tell "Han" that "Leia" is waiting', seed=42)
     assert "Han" in result
     assert "Leia" in result
     assert "tell" not in result.lower()  # Should be transformed
     
     # Double quotes with other text
-    result = rewrite_to_huttese('Bring me "the spice" quickly', seed=42)
+    result = rewrite_cache('Bring me "the spice" quickly', seed=42)
     assert "the spice" in result
     assert "bring" not in result.lower()  # Should be transformed
 
 
-def test_word_swapping():
+def test_word_swapping(rewrite_cache):
     """Test that words are swapped systematically."""
-    from src.audio.translation import rewrite_to_huttese
     
     # Simple test: "one two three four five six seven eight"
     # Should swap: (2,3) and (7,8)
@@ -53,7 +50,7 @@ def test_word_swapping():
     # Then apply transformations
     
     # Test with a sentence long enough to have multiple swaps
-    result = rewrite_to_huttese("bring me the plans quickly from the ship", seed=42)
+    result = rewrite_cache("bring me the plans quickly from the ship", seed=42)
     
     # The original order is: bring me the plans quickly from the ship
     # After swapping (2,3) and (7,8): bring the me plans quickly from ship the
@@ -65,7 +62,7 @@ def test_word_swapping():
     assert len(result) > 0
     
     # Test with short sentence (should still work)
-    result_short = rewrite_to_huttese("hello world", seed=42)
+    result_short = rewrite_cache("hello world", seed=42)
     assert isinstance(result_short, str)
     assert len(result_short) > 0
     
@@ -75,78 +72,61 @@ def test_word_swapping():
     assert result1 == result2
 
 
-def test_literal_phrases_from_env():
-    """Test that phrases from LITERAL_PHRASES env var are preserved."""
-    import os
-    from src.audio.translation import rewrite_to_huttese
-    
-    # Set environment variable for test
-    os.environ["LITERAL_PHRASES"] = "Hendo,Star Wars,Chris"
-    
-    # Reload the module to pick up new env var
-    import importlib
-    import src.audio.translation
-    importlib.reload(src.audio.translation)
-    from src.audio.translation import rewrite_to_huttese
-    
+def test_literal_phrases_from_env(rewrite_cache):
+    """Test that configured literal phrases are preserved."""
+    phrases = ("Hendo", "Star Wars", "Chris")
+
     # Test single word
-    result = rewrite_to_huttese("Tell Hendo to bring the plans", seed=42)
+    result = rewrite_cache("Tell Hendo to bring the plans", seed=42, literal_phrases=phrases)
     assert "Hendo" in result
     assert "tell" not in result.lower()  # Should be transformed
-    
+
     # Test multi-word phrase
-    result = rewrite_to_huttese("I love Star Wars movies", seed=42)
+    result = rewrite_cache("I love Star Wars movies", seed=42, literal_phrases=phrases)
     assert "Star Wars" in result
     assert "love" not in result.lower()  # Should be transformed
-    
+
     # Test case insensitivity
-    result = rewrite_to_huttese("chris is here", seed=42)
+    result = rewrite_cache("chris is here", seed=42, literal_phrases=phrases)
     assert "chris" in result  # Preserves original case
-    
-    # Clean up
-    del os.environ["LITERAL_PHRASES"]
 
 
-def test_punctuation_stays_with_word():
-    """Test that punctuation stays attached to preceding word during word swapping."""
-    from src.audio.translation import rewrite_to_huttese
-    import os
+def test_literal_phrases_env_fallback(monkeypatch):
+    """Test that LITERAL_PHRASES is read from the environment when no argument is given."""
+    # monkeypatch restores the env var on teardown, so nothing leaks even
+    # if an assertion fails; the var is read at call time, no reload needed
+    monkeypatch.setenv("LITERAL_PHRASES", "Hendo,Star Wars")
+
+    result = rewrite_to_huttese("Tell Hendo about Star Wars", seed=42)
+    assert "Hendo" in result
+    assert "Star Wars" in result
+    assert "tell" not in result.lower()  # Should be transformed
 
-    # Set up literal phrases
-    os.environ["LITERAL_PHRASES"] = "Trey,Hagar,dungeonmaster"
 
-    # Reload module
-    import importlib
-    import src.audio.translation
-    importlib.reload(src.audio.translation)
-    from src.audio.translation import rewrite_to_huttese
+def test_punctuation_stays_with_word(rewrite_cache):
+    """Test that punctuation stays attached to preceding word during word swapping."""
+    phrases = ("Trey", "Hagar", "dungeonmaster")
 
     # Test with period in middle
-    result = rewrite_to_huttese("Tell Trey that Hagar loves his dungeonmaster.", seed=42)
+    result = rewrite_cache("Tell Trey that Hagar loves his dungeonmaster.", seed=42, literal_phrases=phrases)
 
     # Period should stay with "dungeonmaster" not become separate word
     assert " . " not in result, f"Period should not be separated: {result}"
     assert "dungeonmaster." in result or result.endswith("dungeonmaster."), f"Period should stay with word: {result}"
 
     # Test with comma
-    result = rewrite_to_huttese("Hello Trey, how are you", seed=42)
+    result = rewrite_cache("Hello Trey, how are you", seed=42, literal_phrases=phrases)
     assert " , " not in result, f"Comma should not be separated: {result}"
 
     # Test with exclamation
-    result = rewrite_to_huttese("Bring me the plans!", seed=42)
+    result = rewrite_cache("Bring me the plans!", seed=42, literal_phrases=phrases)
     assert " ! " not in result, f"Exclamation should not be separated: {result}"
 
-    # Clean up
-    if "LITERAL_PHRASES" in os.environ:
-        del os.environ["LITERAL_PHRASES"]
-
 
-def test_stop_word_stripping_with_quoted_phrases():
+def test_stop_word_stripping_with_quoted_phrases(rewrite_cache):
     """Test that stop words are stripped but quoted phrases are preserved."""
-    from src.audio.translation import rewrite_to_huttese
-
     # Test case 1: Quoted phrase with stop words around it
-    result = rewrite_to_huttese('I don\'t know that this "Belefante Starship" has wings.', seed=42)
+    result = rewrite_cache('I don\'t know that this "Belefante Starship" has wings.', seed=42)
 
     # "Belefante Starship" should be preserved exactly
     assert "Belefante Starship" in result, f"Quoted phrase should be preserved: {result}"
@@ -163,22 +143,10 @@ def test_stop_word_stripping_with_quoted_phrases():
     assert len(words_in_result) < original_word_count, f"Result should be shorter after stop word removal: {result}"
 
 
-def test_stop_word_stripping_with_literal_phrases():
-    """Test that stop words are stripped but literal phrases from env var are preserved."""
-    import os
-    from src.audio.translation import rewrite_to_huttese
-
-    # Set up literal phrase
-    os.environ["LITERAL_PHRASES"] = "Hendo"
-
-    # Reload module
-    import importlib
-    import src.audio.translation
-    importlib.reload(src.audio.translation)
-    from src.audio.translation import rewrite_to_huttese
-
+def test_stop_word_stripping_with_literal_phrases(rewrite_cache):
+    """Test that stop words are stripped but configured literal phrases are preserved."""
     # Test case 2: Literal phrase with stop words around it
-    result = rewrite_to_huttese("I wish you a happy birthday, Hendo!", seed=42)
+    result = rewrite_cache("I wish you a happy birthday, Hendo!", seed=42, literal_phrases=("Hendo",))
 
     # "Hendo" should be preserved exactly
     assert "Hendo" in result, f"Literal phrase should be preserved: {result}"
@@ -191,26 +159,11 @@ def test_stop_word_stripping_with_literal_phrases():
     result_word_count = len(result.split())
     assert result_word_count < original_word_count, f"Result should be shorter after stop word removal: {result}"
 
-    # Clean up
-    del os.environ["LITERAL_PHRASES"]
-
-
-def test_stop_word_stripping_with_multiple_literals():
-    """Test stop word stripping with both quoted and env var literals."""
-    import os
-    from src.audio.translation import rewrite_to_huttese
-
-    # Set up literal phrases
-    os.environ["LITERAL_PHRASES"] = "Mos Eisley"
-
-    # Reload module
-    import importlib
-    import src.audio.translation
-    importlib.reload(src.audio.translation)
-    from src.audio.translation import rewrite_to_huttese
 
+def test_stop_word_stripping_with_multiple_literals(rewrite_cache):
+    """Test stop word stripping with both quoted and configured literals."""
     # Test with both quoted and literal phrases
-    result = rewrite_to_huttese('The "Millennium Falcon" is at the Mos Eisley cantina.', seed=42)
+    result = rewrite_cache('The "Millennium Falcon" is at the Mos Eisley cantina.', seed=42, literal_phrases=("Mos Eisley",))
 
     # Both literals should be preserved
     assert "Millennium Falcon" in result, f"Quoted phrase should be preserved: {result}"
@@ -223,117 +176,80 @@ def test_stop_word_stripping_with_multiple_literals():
     result_word_count = len(result.split())
     assert result_word_count < original_word_count, f"Result should be shorter: {result}"
 
-    # Clean up
-    del os.environ["LITERAL_PHRASES"]
 
-
-def test_stop_word_stripping_disabled():
+def test_stop_word_stripping_disabled(rewrite_cache):
     """Test that stop word stripping can be disabled."""
-    from src.audio.translation import rewrite_to_huttese
-
     text = "I am the one who knocks"
 
     # With stop word stripping enabled (default)
-    result_with_stripping = rewrite_to_huttese(text, seed=42, strip_stop_words=True)
+    result_with_stripping = rewrite_cache(text, seed=42, strip_stop_words=True)
 
     # With stop word stripping disabled
-    result_without_stripping = rewrite_to_huttese(text, seed=42, strip_stop_words=False)
+    result_without_stripping = rewrite_cache(text, seed=42, strip_stop_words=False)
 
     # The version without stripping should have more words
     assert len(result_without_stripping.split()) >= len(result_with_stripping.split()), \
         f"Without stripping should be longer or equal: with={result_with_stripping}, without={result_without_stripping}"
 
 
-def test_nth_word_stripping():
+def test_nth_word_stripping(rewrite_cache):
     """Test that every Nth word can be stripped."""
-    from src.audio.translation import rewrite_to_huttese
-
     # Test with strip_every_nth=3 (strip every 3rd word after stop word removal)
     text = "one two three four five six seven eight nine ten"
 
     # With Nth word stripping
-    result_with_nth = rewrite_to_huttese(text, seed=42, strip_stop_words=False, strip_every_nth=3)
+    result_with_nth = rewrite_cache(text, seed=42, strip_stop_words=False, strip_every_nth=3)
 
     # Without Nth word stripping
-    result_without_nth = rewrite_to_huttese(text, seed=42, strip_stop_words=False, strip_every_nth=0)
+    result_without_nth = rewrite_cache(text, seed=42, strip_stop_words=False, strip_every_nth=0)
 
     # The version with Nth stripping should be shorter
     assert len(result_with_nth.split()) < len(result_without_nth.split()), \
         f"With Nth stripping should be shorter: with={result_with_nth}, without={result_without_nth}"
 
 
-def test_combined_stop_and_nth_word_stripping():
+def test_combined_stop_and_nth_word_stripping(rewrite_cache):
     """Test that stop word and Nth word stripping work together."""
-    from src.audio.translation import rewrite_to_huttese
-
     text = "I am going to the store with my friend for some food"
 
     # With both stop word and Nth word stripping
-    result_both = rewrite_to_huttese(text, seed=42, strip_stop_words=True, strip_every_nth=2)
+    result_both = rewrite_cache(text, seed=42, strip_stop_words=True, strip_every_nth=2)
 
     # With only stop word stripping
-    result_stop_only = rewrite_to_huttese(text, seed=42, strip_stop_words=True, strip_every_nth=0)
+    result_stop_only = rewrite_cache(text, seed=42, strip_stop_words=True, strip_every_nth=0)
 
     # With both should be shorter than stop-only
     assert len(result_both.split()) <= len(result_stop_only.split()), \
         f"Combined should be shorter or equal: both={result_both}, stop_only={result_stop_only}"
-def test_nth_word_stripping_preserves_literals_with_punctuation():
+def test_nth_word_stripping_preserves_literals_with_punctuation(rewrite_cache):
     """Test that Nth word stripping preserves literal phrases even when they have punctuation."""
-    import os
-    from src.audio.translation import rewrite_to_huttese
-
-    # Set up literal phrase
-    os.environ["LITERAL_PHRASES"] = "Hendo"
-
-    # Reload module
-    import importlib
-    import src.audio.translation
-    importlib.reload(src.audio.translation)
-    from src.audio.translation import rewrite_to_huttese
-
     # Test with punctuation after literal phrase
-    result = rewrite_to_huttese("Happy birthday, Hendo, may you enjoy your day fully!", seed=42, strip_stop_words=True, strip_every_nth=3)
+    result = rewrite_cache("Happy birthday, Hendo, may you enjoy your day fully!", seed=42,
+                           strip_stop_words=True, strip_every_nth=3, literal_phrases=("Hendo",))
 
     # "Hendo" should be preserved even though it would be in the 3rd position
     assert "Hendo" in result, f"Literal phrase with punctuation should be preserved: {result}"
 
-    # Clean up
-    del os.environ["LITERAL_PHRASES"]
-
 
-def test_literal_position_preservation():
+def test_literal_position_preservation(rewrite_cache):
     """Test that literals don't move to start/end when they weren't there originally."""
-    import os
-    
-    # Save original env var
-    original_env = os.environ.get("LITERAL_PHRASES")
-    
-    try:
-        os.environ["LITERAL_PHRASES"] = "Hendo"
-        
-        # Test 1: Literal in middle shouldn't move to start
-        result1 = rewrite_to_huttese("Tell Hendo to bring the plans", seed=42, strip_stop_words=True, strip_every_nth=2)
-        assert result1.split()[0].strip(".,!?;:") != "Hendo", f"Hendo shouldn't be at start: {result1}"
-        
-        # Test 2: Literal in middle shouldn't move to end
-        result2 = rewrite_to_huttese("The plans are with Hendo right now", seed=42, strip_stop_words=True, strip_every_nth=2)
-        assert result2.split()[-1].strip(".,!?;:") != "Hendo", f"Hendo shouldn't be at end: {result2}"
-        
-        # Test 3: Literal at end should stay at end
-        result3 = rewrite_to_huttese("I wish you a happy birthday, Hendo!", seed=42, strip_stop_words=True, strip_every_nth=3)
-        assert result3.split()[-1].strip(".,!?;:") == "Hendo", f"Hendo should be at end: {result3}"
-        
-        # Test 4: Literal at start should stay at start
-        result4 = rewrite_to_huttese("Hendo, bring me the plans quickly", seed=42, strip_stop_words=True, strip_every_nth=2)
-        assert result4.split()[0].strip(".,!?;:") == "Hendo", f"Hendo should be at start: {result4}"
-        
-    finally:
-        # Restore original env var
-        if original_env is None:
-            if "LITERAL_PHRASES" in os.environ:
-                del os.environ["LITERAL_PHRASES"]
-        else:
-            os.environ["LITERAL_PHRASES"] = original_env
+    phrases = ("Hendo",)
+
+    # Test 1: Literal in middle shouldn't move to start
+    result1 = rewrite_cache("Tell Hendo to bring the plans", seed=42, strip_stop_words=True, strip_every_nth=2, literal_phrases=phrases)
+    assert result1.split()[0].strip(".,!?;:") != "Hendo", f"Hendo shouldn't be at start: {result1}"
+
+    # Test 2: Literal in middle shouldn't move to end
+    result2 = rewrite_cache("The plans are with Hendo right now", seed=42, strip_stop_words=True, strip_every_nth=2, literal_phrases=phrases)
+    assert result2.split()[-1].strip(".,!?;:") != "Hendo", f"Hendo shouldn't be at end: {result2}"
+
+    # Test 3: Literal at end should stay at end
+    result3 = rewrite_cache("I wish you a happy birthday, Hendo!", seed=42, strip_stop_words=True, strip_every_nth=3, literal_phrases=phrases)
+    assert result3.split()[-1].strip(".,!?;:") == "Hendo", f"Hendo should be at end: {result3}"
+
+    # Test 4: Literal at start should stay at start
+    result4 = rewrite_cache("Hendo, bring me the plans quickly", seed=42, strip_stop_words=True, strip_every_nth=2, literal_phrases=phrases)
+    assert result4.split()[0].strip(".,!?;:") == "Hendo", f"Hendo should be at start: {result4}"
 
 
 def test_double_quotes_with_contractions():
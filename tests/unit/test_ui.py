@@ -1,36 +1,59 @@
 """
 Unit tests for the Huttese UI.
 
-Tests the UI logic without requiring a display (using QTest).
+Tests the UI logic without requiring a display.
 """
 import pytest
-import sys
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import DEFAULT, patch
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import numpy as np
+from PyQt6.QtTest import QSignalSpy
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtTest import QTest
-from PyQt6.QtCore import Qt
+from src.input.ui import HistoryLineEdit, SynthesisWorker, HutteseUI, _run_synthesis
 
-# We need a QApplication instance for Qt widgets
-@pytest.fixture(scope="module")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-    yield app
+# pytest-qt supplies the session-scoped qapp fixture and qtbot, which
+# registers widgets for destruction at teardown (no manual close() calls).
+
+# One shared silent buffer for every mocked sf.read; marked read-only so a
+# test can't mutate what another worker test will be handed.
+_SILENT_24K = np.zeros(1000, dtype=np.float32)
+_SILENT_24K.setflags(write=False)
+
+# Baseline worker settings; variants spread-copy this ({**_BASE_SETTINGS,
+# "semitones": -4}) so parametrized tests don't re-spell the whole dict
+_BASE_SETTINGS = {
+    'seed': 42,
+    'strip_every_nth': 3,
+    'voice': 'Lee',
+    'semitones': -2,
+    'grit_drive': 0,
+    'grit_color': 10,
+    'chorus_ms': 0,
+    'grit_mode': 'combo',
+    'tempo': 0.9,
+}
+
+
+@pytest.fixture
+def make_history_edit(qtbot):
+    """Factory for HistoryLineEdit widgets.
 
+    Keeps widget construction in one place so list-level behaviors can be
+    parametrized against a single factory call instead of each test
+    spelling out its own construction; qtbot destroys the widgets at
+    teardown.
+    """
+    def _make():
+        line_edit = HistoryLineEdit()
+        qtbot.addWidget(line_edit)
+        return line_edit
+    return _make
 
-def test_history_line_edit_recall(qapp):
+
+def test_history_line_edit_recall(make_history_edit):
     """Test that HistoryLineEdit can recall previous inputs."""
-    from src.input.ui import HistoryLineEdit
-    
-    line_edit = HistoryLineEdit()
-    
+    line_edit = make_history_edit()
+
     # Add some history
     line_edit.add_to_history("first text")
     line_edit.add_to_history("second text")
@@ -55,12 +78,10 @@ def test_history_line_edit_recall(qapp):
     assert line_edit.text() == "second text"
 
 
-def test_history_line_edit_recall_stack(qapp):
+def test_history_line_edit_recall_stack(make_history_edit):
     """Test that recall stack works when clicking history."""
-    from src.input.ui import HistoryLineEdit
-    
-    line_edit = HistoryLineEdit()
-    
+    line_edit = make_history_edit()
+
     # Set some text
     line_edit.setText("current text")
     
@@ -75,148 +96,191 @@ def test_history_line_edit_recall_stack(qapp):
     assert line_edit.text() == "current text"
 
 
-def test_history_line_edit_no_duplicates(qapp):
+@pytest.mark.parametrize("sequence,expected", [
+    # Consecutive duplicates are dropped
+    (["same text", "same text", "different text", "different text"],
+     ["same text", "different text"]),
+    # Non-consecutive repeats are kept
+    (["first", "second", "first"],
+     ["first", "second", "first"]),
+])
+def test_history_line_edit_no_duplicates(make_history_edit, sequence, expected):
     """Test that duplicate consecutive entries are not added to history."""
-    from src.input.ui import HistoryLineEdit
-    
-    line_edit = HistoryLineEdit()
-    
-    line_edit.add_to_history("same text")
-    line_edit.add_to_history("same text")
-    line_edit.add_to_history("different text")
-    line_edit.add_to_history("different text")
-    
-    # Should only have 2 items (duplicates removed)
-    assert len(line_edit.input_history) == 2
-    assert line_edit.input_history == ["same text", "different text"]
-
-
-@patch('src.input.ui.synth_to_wav')
-@patch('src.input.ui.process_klatooinian')
-@patch('src.input.ui.sd.play')
-@patch('src.input.ui.sd.wait')
-@patch('src.input.ui.sf.read')
-def test_synthesis_worker(mock_sf_read, mock_sd_wait, mock_sd_play, 
-                          mock_process, mock_synth, qapp):
-    """Test that SynthesisWorker processes text correctly."""
-    from src.input.ui import SynthesisWorker
-    import numpy as np
-    
-    # Mock the audio file reading
-    mock_sf_read.return_value = (np.zeros(1000, dtype=np.float32), 24000)
-    
-    settings = {
-        'seed': 42,
-        'strip_every_nth': 3,
-        'voice': 'Lee',
-        'semitones': -2,
-        'grit_drive': 0,
-        'grit_color': 10,
-        'chorus_ms': 0,
-        'grit_mode': 'combo',
-        'tempo': 0.9,
-    }
-    
-    worker = SynthesisWorker("Hello world", settings)
-    
-    # Track if signals were emitted
-    translation_ready_called = []
-    finished_called = []
-    
-    worker.translation_ready.connect(
-        lambda eng, hut: translation_ready_called.append((eng, hut))
-    )
-    worker.finished.connect(
-        lambda elapsed: finished_called.append(elapsed)
+    line_edit = make_history_edit()
+
+    for text in sequence:
+        line_edit.add_to_history(text)
+
+    assert line_edit.input_history == expected
+
+
+@pytest.fixture
+def worker_mocks():
+    """Patch the synthesis/audio stack once for worker tests.
+
+    One patch.multiple call replaces five separate patches: the sd/sf
+    modules are swapped wholesale (their play/wait/read attributes come
+    along for free as mock children), and additional worker tests reuse
+    the fixture without re-declaring the mock plumbing.
+    """
+    from types import SimpleNamespace
+
+    with patch.multiple(
+        'src.input.ui',
+        synth_to_wav=DEFAULT,
+        process_klatooinian=DEFAULT,
+        sd=DEFAULT,
+        sf=DEFAULT,
+    ) as mocks:
+        # Mock the audio file reading
+        mocks['sf'].read.return_value = (_SILENT_24K, 24000)
+        yield SimpleNamespace(
+            synth=mocks['synth_to_wav'],
+            process=mocks['process_klatooinian'],
+            sd_play=mocks['sd'].play,
+            sd_wait=mocks['sd'].wait,
+            sf_read=mocks['sf'].read,
+        )
+
+
+def test_run_synthesis_pipeline(worker_mocks, tmp_path):
+    """Test the synthesis pipeline directly, with no QThread involved."""
+    translated = []
+
+    huttese, elapsed = _run_synthesis(
+        "Hello world", {**_BASE_SETTINGS}, tmp_path,
+        on_translated=lambda eng, hut: translated.append((eng, hut)),
     )
-    
+
+    # Translation is reported before synthesis, with the final huttese text
+    assert translated == [("Hello world", huttese)]
+    assert isinstance(huttese, str)
+    assert elapsed >= 0
+
+    # The full synth -> effects -> playback chain ran
+    assert worker_mocks.synth.called
+    assert worker_mocks.process.called
+    assert worker_mocks.sd_play.called
+
+
+def test_synthesis_worker(worker_mocks, qapp):
+    """Test that SynthesisWorker wires the pipeline to its Qt signals."""
+    worker = SynthesisWorker("Hello world", {**_BASE_SETTINGS})
+
+    # Record emissions with QSignalSpy: it captures arguments in C++
+    # without dispatching through Python lambda slots
+    translation_spy = QSignalSpy(worker.translation_ready)
+    finished_spy = QSignalSpy(worker.finished)
+
     # Run the worker
     worker.run()
-    
+
     # Verify synthesis was called
-    assert mock_synth.called
-    assert mock_process.called
-    assert mock_sd_play.called
-    
+    assert worker_mocks.synth.called
+    assert worker_mocks.process.called
+    assert worker_mocks.sd_play.called
+
     # Verify translation_ready signal was emitted
-    assert len(translation_ready_called) == 1
-    english, huttese = translation_ready_called[0]
+    assert len(translation_spy) == 1
+    english, huttese = translation_spy[0]
     assert english == "Hello world"
     assert isinstance(huttese, str)
-    
+
     # Verify finished signal was emitted
-    assert len(finished_called) == 1
-    elapsed = finished_called[0]
+    assert len(finished_spy) == 1
+    elapsed = finished_spy[0][0]
     assert elapsed >= 0
 
 
+@pytest.fixture(scope="module")
+def ui_window(qapp):
+    """One HutteseUI shared by the tests that only read or reset its state.
+
+    Widget construction (layout, stylesheet, child widgets) dominates these
+    tests, so it happens once per module; each test clears the mutable
+    history state before using the window. The initialization test builds
+    its own instance since fresh-construction state is what it asserts.
+
+    Roll20Worker is mocked out: the real one starts a background service
+    thread whose queued error signal would pop a modal dialog as soon as
+    events are processed between tests.
+    """
+    with patch('src.input.ui.Roll20Worker'):
+        window = HutteseUI()
+        yield window
+        window.close()
+
+
 def test_huttese_ui_initialization(qapp):
-    """Test that HutteseUI initializes correctly."""
-    from src.input.ui import HutteseUI
-    
-    window = HutteseUI()
-    
-    # Check that settings are initialized
-    assert window.settings['voice'] == 'Lee'
-    assert window.settings['semitones'] == -2
-    assert window.settings['strip_every_nth'] == 3
-    
-    # Check that history is empty
-    assert len(window.history) == 0
-    
-    # Check that UI elements exist
-    assert window.input_field is not None
-    assert window.say_button is not None
-    assert window.history_log is not None
-    
-    # Check window properties
-    assert window.windowTitle() == "🎙️ Huttese Synthesizer"
-    
-    window.close()
+    """Test that HutteseUI initializes correctly.
 
+    Builds (and closes) its own window since fresh-construction state is
+    the thing under test. The window is closed rather than handed to
+    qtbot: destroying the QObject tree is unnecessary here and close() is
+    what the app itself does.
+    """
+    with patch('src.input.ui.Roll20Worker'):
+        window = HutteseUI()
+
+        # Check that settings are initialized
+        assert window.settings['voice'] == 'Lee'
+        assert window.settings['semitones'] == -2
+        assert window.settings['strip_every_nth'] == 3
+
+        # Check that history is empty
+        assert len(window.history) == 0
+
+        # Check that UI elements exist
+        assert window.input_field is not None
+        assert window.say_button is not None
+        assert window.history_log is not None
+
+        # Check window properties
+        assert window.windowTitle() == "🎙️ Klatooinian Huttese Synthesizer"
+
+        window.close()
+
+
+@pytest.mark.parametrize("entries", [
+    [("Hello", "halo")],
+    [("Hello", "halo"), ("Goodbye", "choodbye")],
+    [("A", "ah"), ("B", "bah"), ("C", "chah")],
+])
+def test_huttese_ui_history_update(ui_window, entries):
+    """Test that history display updates correctly at varied sizes."""
+    ui_window.history.clear()
+    ui_window.history_log.clear()
 
-def test_huttese_ui_history_update(qapp):
-    """Test that history display updates correctly."""
-    from src.input.ui import HutteseUI
-    
-    window = HutteseUI()
-    
     # Add some history
-    window.history.append(("Hello", "halo"))
-    window.history.append(("Goodbye", "choodbye"))
-    
+    ui_window.history.extend(entries)
+
     # Update display
-    window.update_history_display()
-    
-    # Check that HTML was generated
-    html = window.history_log.toHtml()
-    assert "Hello" in html
-    assert "halo" in html
-    assert "Goodbye" in html
-    assert "choodbye" in html
-    
-    window.close()
+    ui_window.update_history_display()
 
+    # Check that every entry was rendered. toPlainText() avoids the full
+    # QTextDocument->HTML serialization; the rendered text is what matters
+    text = ui_window.history_log.toPlainText()
+    for english, huttese in entries:
+        assert english in text
+        assert huttese in text
 
-def test_huttese_ui_translation_ready_updates_history(qapp):
+
+def test_huttese_ui_translation_ready_updates_history(ui_window):
     """Test that history is updated when translation is ready (before playback)."""
-    from src.input.ui import HutteseUI
-    
-    window = HutteseUI()
-    
+    ui_window.history.clear()
+    ui_window.history_log.clear()
+
     # Simulate translation_ready signal
-    window.on_translation_ready("Test input", "testa inaputa")
-    
+    ui_window.on_translation_ready("Test input", "testa inaputa")
+
     # Check that history was updated
-    assert len(window.history) == 1
-    assert window.history[0] == ("Test input", "testa inaputa")
-    
+    assert len(ui_window.history) == 1
+    assert ui_window.history[0] == ("Test input", "testa inaputa")
+
     # Check that display was updated
-    html = window.history_log.toHtml()
-    assert "Test input" in html
-    assert "testa inaputa" in html
-    
-    window.close()
+    text = ui_window.history_log.toPlainText()
+    assert "Test input" in text
+    assert "testa inaputa" in text
 
 
 if __name__ == "__main__":